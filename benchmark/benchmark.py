@@ -2,18 +2,35 @@
 """Performance benchmark for the GeoMag Python library.
 
 This benchmark measures the time to process different numbers of
-geomag calculations (10000, 30000, 50000, 100000 records).
+geomag calculations (10000, 30000, 50000, 100000 records), both one
+call per record and as a single batch call.
 """
 
 import sys
 import time
 from pathlib import Path
 
+import numpy as np
+
 # Add parent directory to path to import geomag_c
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from geomag_c import GeoMag
 
+# Test locations with varied coordinates, one (lat, lon, alt, time) row each
+TEST_DATA = np.array([
+    (47.6205, -122.3493, 0.0, 2025.25),     # Seattle
+    (40.7128, -74.0060, 0.1, 2025.5),       # New York
+    (34.0522, -118.2437, 0.05, 2025.75),    # Los Angeles
+    (25.7617, -80.1918, 0.0, 2026.0),       # Miami
+    (41.8781, -87.6298, 0.2, 2025.3),       # Chicago
+    (51.5074, -0.1278, 0.0, 2025.4),        # London
+    (35.6762, 139.6503, 0.0, 2025.6),       # Tokyo
+    (-33.8688, 151.2093, 0.0, 2025.8),      # Sydney
+    (0.0, 0.0, 0.0, 2025.5),                # Null Island
+    (90.0, 0.0, 0.0, 2025.5)                # North Pole
+], dtype=np.float64)
+
 
 def format_time(seconds):
     """Format time in appropriate units."""
@@ -25,61 +42,119 @@ def format_time(seconds):
         return f"{seconds:.2f} s"
 
 
-def run_benchmark(geo_mag, num_records):
-    """Run benchmark for a given number of records."""
-    # Test locations with varied coordinates
-    test_data = [
-        (47.6205, -122.3493, 0.0, 2025.25),     # Seattle
-        (40.7128, -74.0060, 0.1, 2025.5),       # New York
-        (34.0522, -118.2437, 0.05, 2025.75),    # Los Angeles
-        (25.7617, -80.1918, 0.0, 2026.0),       # Miami
-        (41.8781, -87.6298, 0.2, 2025.3),       # Chicago
-        (51.5074, -0.1278, 0.0, 2025.4),        # London
-        (35.6762, 139.6503, 0.0, 2025.6),       # Tokyo
-        (-33.8688, 151.2093, 0.0, 2025.8),      # Sydney
-        (0.0, 0.0, 0.0, 2025.5),                # Null Island
-        (90.0, 0.0, 0.0, 2025.5)                # North Pole
+def print_results(num_records, elapsed_seconds):
+    """Print timing statistics for the first num_records of a benchmark run."""
+    elapsed_ms = elapsed_seconds * 1000
+
+    # Calculate statistics
+    avg_time_us = (elapsed_seconds * 1_000_000) / num_records
+    records_per_sec = num_records / elapsed_seconds
+
+    print(f"First {num_records:,} records:")
+    print(f"  Total time:        {elapsed_ms:10.2f} ms")
+    print(f"  Average per calc:  {avg_time_us:10.3f} µs")
+    print(f"  Throughput:        {records_per_sec:10,.0f} calcs/sec")
+    print()
+
+
+def build_records(num_records):
+    """Build a (num_records, 4) array of lat, lon, alt, time rows.
+
+    The test locations are repeated up front so the timed loops do no
+    per-record index arithmetic.
+    """
+    repeats = -(-num_records // len(TEST_DATA))
+    return np.tile(TEST_DATA, (repeats, 1))[:num_records]
+
+
+def warm_up(geo_mag):
+    """Run both calculation paths once so first-call costs are not timed.
+
+    This covers lazy symbol binding in the shared library and cold caches
+    for the model coefficients.
+    """
+    lat, lon, alt, date_time = TEST_DATA[0].tolist()
+    geo_mag.calculate(lat, lon, alt, date_time, True, False)
+    geo_mag.calculate_batch(*TEST_DATA.T, allow_date_outside_lifespan=True)
+
+
+def segment_bounds(record_counts):
+    """Return (start, stop) pairs splitting the largest count at each smaller one."""
+    return list(zip([0] + record_counts[:-1], record_counts))
+
+
+def run_benchmark(geo_mag, record_counts):
+    """Run benchmark once over the largest of the ascending record_counts.
+
+    The smaller counts are prefixes of the largest, so their timings are
+    cumulative snapshots taken on the way instead of separate runs.
+    """
+    # Plain Python floats are the cheapest thing to hand to ctypes per call
+    records = build_records(record_counts[-1]).tolist()
+    segments = [records[start:stop] for start, stop in segment_bounds(record_counts)]
+    checkpoints = []
+
+    print(f"Processing {len(records):,} records... ", end='', flush=True)
+    warm_up(geo_mag)
+
+    # Start timing
+    start_time = time.perf_counter()
+
+    # Run calculations; one exception handler for the whole loop rather than
+    # one per iteration
+    try:
+        for segment in segments:
+            for lat, lon, alt, date_time in segment:
+                # Positional arguments (lat, lon, alt, time,
+                # allow_date_outside_lifespan, raise_in_warning_zone) avoid
+                # building a keyword dict on every call
+                geo_mag.calculate(lat, lon, alt, date_time, True, False)
+            checkpoints.append(time.perf_counter())
+    except Exception as e:
+        print(f"\nError in calculation: {e}")
+        return
+
+    print("Done!")
+    print()
+    for count, end_time in zip(record_counts, checkpoints):
+        print_results(count, end_time - start_time)
+
+
+def run_batch_benchmark(geo_mag, record_counts):
+    """Run batch benchmark once over the largest of the ascending record_counts.
+
+    Each segment between consecutive counts is one calculate_batch call.
+    """
+    records = build_records(record_counts[-1])
+    columns = [np.ascontiguousarray(col) for col in records.T]
+    segments = [
+        [col[start:stop] for col in columns]
+        for start, stop in segment_bounds(record_counts)
     ]
-    num_test_locations = len(test_data)
+    checkpoints = []
 
-    print(f"Processing {num_records:,} records... ", end='', flush=True)
+    print(f"Processing {len(records):,} records (batch)... ", end='', flush=True)
+    warm_up(geo_mag)
 
     # Start timing
     start_time = time.perf_counter()
 
-    # Run calculations
-    for i in range(num_records):
-        # Cycle through test locations
-        idx = i % num_test_locations
-        lat, lon, alt, date_time = test_data[idx]
-
-        try:
-            result = geo_mag.calculate(
-                lat=lat,
-                lon=lon,
-                alt=alt,
-                time=date_time,
+    try:
+        for lats, lons, alts, times in segments:
+            geo_mag.calculate_batch(
+                lats, lons, alts, times,
                 allow_date_outside_lifespan=True,
                 raise_in_warning_zone=False
             )
-        except Exception as e:
-            print(f"\nError in calculation {i}: {e}")
-            return
-
-    # End timing
-    end_time = time.perf_counter()
-    elapsed_seconds = end_time - start_time
-    elapsed_ms = elapsed_seconds * 1000
-
-    # Calculate statistics
-    avg_time_us = (elapsed_seconds * 1_000_000) / num_records
-    records_per_sec = num_records / elapsed_seconds
+            checkpoints.append(time.perf_counter())
+    except Exception as e:
+        print(f"\nError in batch calculation: {e}")
+        return
 
     print("Done!")
-    print(f"  Total time:        {elapsed_ms:10.2f} ms")
-    print(f"  Average per calc:  {avg_time_us:10.3f} µs")
-    print(f"  Throughput:        {records_per_sec:10,.0f} calcs/sec")
     print()
+    for count, end_time in zip(record_counts, checkpoints):
+        print_results(count, end_time - start_time)
 
 
 def main():
@@ -112,8 +187,9 @@ def main():
     print()
 
     # Run benchmarks
-    for count in record_counts:
-        run_benchmark(geo_mag, count)
+    run_benchmark(geo_mag, record_counts)
+    run_batch_benchmark(geo_mag, record_counts)
+    geo_mag.close()
 
     # Now test with high resolution model
     print("="*80)
@@ -139,9 +215,10 @@ def main():
         print("-"*80)
         print()
 
-        # Run smaller benchmarks for high resolution (slower)
-        for count in record_counts:
-            run_benchmark(geo_mag_hr, count)
+        # Same record counts as the standard model
+        run_benchmark(geo_mag_hr, record_counts)
+        run_batch_benchmark(geo_mag_hr, record_counts)
+        geo_mag_hr.close()
 
     print("="*80)
     print("Benchmark completed!")
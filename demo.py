@@ -9,9 +9,13 @@ This script demonstrates various features of the World Magnetic Model (WMM) libr
 - High-resolution model comparison
 - Warning zones (blackout and caution zones)
 - Time series analysis
+- Batched calculations over many points at once
 """
 
 import sys
+
+import numpy as np
+
 from geomag_c import GeoMag
 
 
@@ -22,12 +26,10 @@ def print_section(title):
     print(f"{'=' * 70}\n")
 
 
-def demo_basic_usage():
+def demo_basic_usage(gm):
     """Demonstrate basic usage of the library."""
     print_section("1. Basic Usage - Calculate Magnetic Declination")
 
-    # Initialize with WMM-2025 model
-    gm = GeoMag()
     print("Model Information:")
     print(f"  Name:         {gm.model}")
     print(f"  Epoch:        {gm.epoch}")
@@ -78,12 +80,10 @@ def demo_basic_usage():
         )
 
 
-def demo_uncertainty():
+def demo_uncertainty(gm):
     """Demonstrate uncertainty calculations."""
     print_section("2. Uncertainty Estimation")
 
-    gm = GeoMag()
-
     # New York City
     result = gm.calculate(lat=40.7128, lon=-74.0060, alt=0.0, time=2025.5)
     uncertainty = gm.calculate_uncertainty(result)
@@ -103,11 +103,10 @@ def demo_uncertainty():
     )
 
 
-def demo_world_locations():
+def demo_world_locations(gm):
     """Demonstrate calculations at various locations around the world."""
     print_section("3. Magnetic Field Around the World")
 
-    gm = GeoMag()
     time = 2025.5  # Mid-2025
 
     locations = [
@@ -129,19 +128,24 @@ def demo_world_locations():
     )
     print("-" * 88)
 
-    for name, lat, lon in locations:
-        result = gm.calculate(lat=lat, lon=lon, alt=0.0, time=time)
+    # One batched call for all locations
+    names = [name for name, _, _ in locations]
+    lats = np.array([lat for _, lat, _ in locations])
+    lons = np.array([lon for _, _, lon in locations])
+    res = gm.calculate_batch(lats, lons, 0.0, time)
+
+    for name, lat, lon, decl, incl, total in zip(
+        names, lats, lons, res.declination, res.inclination, res.total_intensity
+    ):
         print(
-            f"{name:<25} {lat:>10.4f} {lon:>11.4f} {result.declination:>10.2f} {result.inclination:>10.2f} {result.total_intensity:>12.1f}"
+            f"{name:<25} {lat:>10.4f} {lon:>11.4f} {decl:>10.2f} {incl:>10.2f} {total:>12.1f}"
         )
 
 
-def demo_altitude_effects():
+def demo_altitude_effects(gm):
     """Demonstrate how altitude affects magnetic field."""
     print_section("4. Altitude Effects on Magnetic Field")
 
-    gm = GeoMag()
-
     # Mount Everest location
     latitude = 27.9881
     longitude = 86.9250
@@ -159,22 +163,22 @@ def demo_altitude_effects():
     print(f"{'Altitude':<35} {'Decl (°)':>10} {'Total (nT)':>12} {'Change (nT)':>12}")
     print("-" * 70)
 
-    sea_level_result = gm.calculate(lat=latitude, lon=longitude, alt=0.0, time=time)
+    # Sea level reference first, then every altitude, in one batched call
+    alts = np.array([0.0] + [alt_km for alt_km, _ in altitudes])
+    res = gm.calculate_batch(latitude, longitude, alts, time)
+    sea_level_total = res.total_intensity[0]
 
-    for alt_km, description in altitudes:
-        result = gm.calculate(lat=latitude, lon=longitude, alt=alt_km, time=time)
-        change = result.total_intensity - sea_level_result.total_intensity
-        print(
-            f"{description:<35} {result.declination:>10.4f} {result.total_intensity:>12.1f} {change:>12.1f}"
-        )
+    for (_, description), decl, total in zip(
+        altitudes, res.declination[1:], res.total_intensity[1:]
+    ):
+        change = total - sea_level_total
+        print(f"{description:<35} {decl:>10.4f} {total:>12.1f} {change:>12.1f}")
 
 
-def demo_time_series():
+def demo_time_series(gm):
     """Demonstrate temporal variation of magnetic field."""
     print_section("5. Temporal Variation (Secular Variation)")
 
-    gm = GeoMag()
-
     # Seattle, WA - Space Needle
     latitude = 47.6205
     longitude = -122.3493
@@ -183,62 +187,40 @@ def demo_time_series():
     print(f"Location: Space Needle, Seattle, WA ({latitude:.4f}°N, {longitude:.4f}°W)")
     print("Tracking declination change over 5 years (WMM-2025 valid period)\n")
 
-    years = [
-        2025.0,
-        2025.5,
-        2026.0,
-        2026.5,
-        2027.0,
-        2027.5,
-        2028.0,
-        2028.5,
-        2029.0,
-        2029.5,
-        2030.0,
-    ]
+    # Every half year across the model lifespan
+    years = np.linspace(2025.0, 2030.0, 11)
 
     print(f"{'Year':<10} {'Date':<12} {'Declination':>12} {'Annual Change':>14}")
     print("-" * 50)
 
-    prev_result = None
-    prev_year = None
-    for year in years:
-        result = gm.calculate(lat=latitude, lon=longitude, alt=altitude, time=year)
+    # The single location is broadcast against all years
+    res = gm.calculate_batch(latitude, longitude, altitude, years)
+
+    # Convert decimal years to "YYYY-MM" labels
+    date_strs = [f"{int(y)}-{int((y - int(y)) * 12) + 1:02d}" for y in years]
 
-        if prev_result is None:
+    prev_decl = None
+    prev_year = None
+    for year, date_str, decl in zip(years, date_strs, res.declination):
+        if prev_decl is None:
             change_str = "---"
         else:
-            annual_change = (result.declination - prev_result.declination) / (
-                year - prev_year
-            )
+            annual_change = (decl - prev_decl) / (year - prev_year)
             change_str = f"{annual_change:+.4f}°/year"
 
-        # Convert decimal year to month
-        year_int = int(year)
-        month = int((year - year_int) * 12) + 1
-        date_str = f"{year_int}-{month:02d}"
-
-        print(
-            f"{year:<10.1f} {date_str:<12} {result.declination:>12.4f}° {change_str:>14}"
-        )
+        print(f"{year:<10.1f} {date_str:<12} {decl:>12.4f}° {change_str:>14}")
 
-        prev_result = result
+        prev_decl = decl
         prev_year = year
 
     print("\nNote: The magnetic field changes continuously due to core dynamics.")
     print("      WMM models include secular variation to predict these changes.")
 
 
-def demo_high_resolution():
+def demo_high_resolution(gm_std, gm_hr):
     """Demonstrate high-resolution model comparison."""
     print_section("6. High-Resolution Model Comparison")
 
-    # Standard model (12 degrees)
-    gm_std = GeoMag(high_resolution=False)
-
-    # High-resolution model (133 degrees)
-    gm_hr = GeoMag(high_resolution=True)
-
     print("Model Comparison:")
     print(f"  Standard Model: {gm_std.model} ({gm_std.maxord} degrees)")
     print(f"  High-Res Model: {gm_hr.model} ({gm_hr.maxord} degrees)")
@@ -272,11 +254,10 @@ def demo_high_resolution():
     print("      precision navigation and geophysical surveys.")
 
 
-def demo_warning_zones():
+def demo_warning_zones(gm):
     """Demonstrate warning zones near magnetic poles."""
     print_section("7. Warning Zones (Blackout and Caution Zones)")
 
-    gm = GeoMag()
     time = 2025.5
 
     locations = [
@@ -317,11 +298,10 @@ def demo_warning_zones():
     )
 
 
-def demo_compass_calibration():
+def demo_compass_calibration(gm):
     """Demonstrate practical compass calibration."""
     print_section("8. Practical Application - Compass Calibration")
 
-    gm = GeoMag()
     time = 2025.5
 
     print("Common US Cities - Compass Correction Reference:\n")
@@ -337,31 +317,34 @@ def demo_compass_calibration():
         ("Boston, MA", 42.3601, -71.0589),
     ]
 
-    for name, lat, lon in cities:
-        result = gm.calculate(lat=lat, lon=lon, alt=0.0, time=time)
+    # One batched call for all cities
+    lats = np.array([lat for _, lat, _ in cities])
+    lons = np.array([lon for _, _, lon in cities])
+    res = gm.calculate_batch(lats, lons, 0.0, time)
 
+    for (name, lat, lon), declination in zip(cities, res.declination):
         print(f"{name}:")
         print(f"  Location: {lat:.4f}°N, {abs(lon):.4f}°W")
-        print(f"  Declination: {result.declination:.2f}°")
+        print(f"  Declination: {declination:.2f}°")
 
-        if result.declination > 0:
+        if declination > 0:
             print(
-                f"  Correction: Compass reads {abs(result.declination):.2f}° EAST of True North"
+                f"  Correction: Compass reads {abs(declination):.2f}° EAST of True North"
             )
             print(
-                f"  To navigate: Subtract {abs(result.declination):.2f}° from compass bearing"
+                f"  To navigate: Subtract {abs(declination):.2f}° from compass bearing"
             )
         else:
             print(
-                f"  Correction: Compass reads {abs(result.declination):.2f}° WEST of True North"
+                f"  Correction: Compass reads {abs(declination):.2f}° WEST of True North"
             )
             print(
-                f"  To navigate: Add {abs(result.declination):.2f}° to compass bearing"
+                f"  To navigate: Add {abs(declination):.2f}° to compass bearing"
             )
 
         # Example bearing
         compass_bearing = 45.0  # Northeast
-        true_bearing = compass_bearing - result.declination
+        true_bearing = compass_bearing - declination
         print(
             f"  Example: Compass shows {compass_bearing:.0f}° → True bearing is {true_bearing:.1f}°"
         )
@@ -378,14 +361,18 @@ def main():
     print("*" * 70)
 
     try:
-        demo_basic_usage()
-        demo_uncertainty()
-        demo_world_locations()
-        demo_altitude_effects()
-        demo_time_series()
-        demo_high_resolution()
-        demo_warning_zones()
-        demo_compass_calibration()
+        # Load each model once and share it between the demos
+        with GeoMag() as gm, GeoMag(high_resolution=True) as gm_hr:
+            # gm: standard WMM-2025 model (12 degrees)
+            # gm_hr: high-resolution model (133 degrees)
+            demo_basic_usage(gm)
+            demo_uncertainty(gm)
+            demo_world_locations(gm)
+            demo_altitude_effects(gm)
+            demo_time_series(gm)
+            demo_high_resolution(gm, gm_hr)
+            demo_warning_zones(gm)
+            demo_compass_calibration(gm)
 
         print_section("Demo Complete!")
         print("All demonstrations completed successfully.")
@@ -91,6 +91,10 @@ def main():
     print(f"  In caution zone: {result.in_caution_zone}")
     print(f"  High resolution: {result.is_high_resolution}")
 
+    # Release the C resources (or use "with GeoMag() as gm:")
+    gm.close()
+    gm_hr.close()
+
     print("\n=== All examples completed successfully! ===")
 
 
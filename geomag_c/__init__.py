@@ -15,12 +15,33 @@ Example:
     >>> print(f"Declination: {result.declination:.2f}°")
     >>> print(f"Inclination: {result.inclination:.2f}°")
     >>>
+    >>> # Calculate many points in a single call
+    >>> res = gm.calculate_batch([47.6205, 40.7128], [-122.3493, -74.0060], 0.0, 2025.5)
+    >>>
     >>> # Use high-resolution model for more accuracy
     >>> gm_hr = GeoMag(high_resolution=True)
 """
 
-from .geomag import GeoMag, GeoMagResult, GeoMagUncertainty
+from .geomag import (
+    GeoMag,
+    GeoMagBatchResult,
+    GeoMagColumns,
+    GeoMagResult,
+    GeoMagResultPy,
+    GeoMagUncertainty,
+    PreparedGeoMag,
+    RESULT_DTYPE,
+)
 
 __version__ = "1.0.0"
 __author__ = "Justin"
-__all__ = ["GeoMag", "GeoMagResult", "GeoMagUncertainty"]
+__all__ = [
+    "GeoMag",
+    "GeoMagBatchResult",
+    "GeoMagColumns",
+    "GeoMagResult",
+    "GeoMagResultPy",
+    "GeoMagUncertainty",
+    "PreparedGeoMag",
+    "RESULT_DTYPE",
+]
@@ -0,0 +1,49 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Optional Cython binding for the per-point GeoMag.calculate path.
+
+Built only when installing with ``USE_CYTHON=1``. A typed call here skips
+the argument conversion ctypes does on every call; GeoMag falls back to
+ctypes when this module is not available.
+"""
+
+from cpython.buffer cimport PyBUF_WRITABLE, PyBuffer_Release, PyObject_GetBuffer
+from libc.stdint cimport uintptr_t
+
+
+cdef extern from "geomag.h":
+    ctypedef struct GeoMag:
+        pass
+
+    ctypedef struct GeoMagResult:
+        pass
+
+    int geomag_calculate(GeoMag *geo_mag, double glat, double glon, double alt,
+                         double time, bint allow_date_outside_lifespan,
+                         bint raise_in_warning_zone, GeoMagResult *result) nogil
+
+
+def calculate(uintptr_t handle, double lat, double lon, double alt, double time,
+              bint allow_date_outside_lifespan, bint raise_in_warning_zone,
+              object result):
+    """Run geomag_calculate on the model at address handle.
+
+    result must be a writable GeoMagResult ctypes structure; it is filled
+    in place through its buffer. Returns the geomag_calculate status code,
+    or -1 for a zero (closed) handle.
+    """
+    cdef Py_buffer view
+    cdef int ret
+
+    if handle == 0:
+        return -1
+
+    PyObject_GetBuffer(result, &view, PyBUF_WRITABLE)
+    try:
+        with nogil:
+            ret = geomag_calculate(<GeoMag *>handle, lat, lon, alt, time,
+                                   allow_date_outside_lifespan, raise_in_warning_zone,
+                                   <GeoMagResult *>view.buf)
+    finally:
+        PyBuffer_Release(&view)
+
+    return ret
@@ -3,7 +3,45 @@
 import ctypes
 import os
 import platform
+import struct
+import threading
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+try:
+    from . import _geomag_fast
+except ImportError:
+    # Optional Cython extension (USE_CYTHON=1); ctypes is used without it
+    _geomag_fast = None
+
+
+class GeoMagResultPy(NamedTuple):
+    """Magnetic field result as plain Python values.
+
+    Same fields as GeoMagResult, read out of the C structure in one go so
+    that later attribute access costs no ctypes conversions.
+    """
+
+    time: float
+    alt: float
+    glat: float
+    glon: float
+    x: float
+    y: float
+    z: float
+    h: float
+    f: float
+    i: float
+    d: float
+    gv: float
+    in_blackout_zone: bool
+    in_caution_zone: bool
+    is_high_resolution: bool
 
 
 class GeoMagResult(ctypes.Structure):
@@ -80,6 +118,14 @@ class GeoMagResult(ctypes.Structure):
         """Vertical component (down positive) in nT."""
         return self.z
 
+    def to_namedtuple(self) -> GeoMagResultPy:
+        """Return all fields as a GeoMagResultPy of plain Python values.
+
+        Unpacks the structure's memory with a single struct call instead of
+        one ctypes attribute access per field.
+        """
+        return GeoMagResultPy._make(_RESULT_STRUCT.unpack_from(self))
+
     def __repr__(self) -> str:
         return (
             f"GeoMagResult(lat={self.glat:.4f}, lon={self.glon:.4f}, "
@@ -88,6 +134,87 @@ class GeoMagResult(ctypes.Structure):
         )
 
 
+# Native layout of GeoMagResult: 12 doubles followed by 3 bools
+_RESULT_STRUCT = struct.Struct("12d3?")
+
+# NumPy dtype of one GeoMagResult, for structured arrays that the C library
+# fills directly (see GeoMag.calculate_many)
+RESULT_DTYPE = np.dtype(
+    [
+        ("time", "f8"),
+        ("alt", "f8"),
+        ("glat", "f8"),
+        ("glon", "f8"),
+        ("x", "f8"),
+        ("y", "f8"),
+        ("z", "f8"),
+        ("h", "f8"),
+        ("f", "f8"),
+        ("i", "f8"),
+        ("d", "f8"),
+        ("gv", "f8"),
+        ("in_blackout_zone", "?"),
+        ("in_caution_zone", "?"),
+        ("is_high_resolution", "?"),
+    ],
+    align=True,
+)
+assert RESULT_DTYPE.itemsize == ctypes.sizeof(GeoMagResult) and all(
+    RESULT_DTYPE.fields[name][1] == getattr(GeoMagResult, name).offset
+    for name, _ in GeoMagResult._fields_
+), "RESULT_DTYPE does not match the GeoMagResult layout"
+
+
+class GeoMagBatchResult(NamedTuple):
+    """Magnetic field results for a batch of points.
+
+    Each attribute is a float64 array with the broadcast shape of the inputs
+    passed to GeoMag.calculate_batch.
+
+    Attributes:
+        declination: Declination (magnetic variation) in degrees
+        inclination: Inclination (dip angle) in degrees
+        north_component: North component in nT
+        east_component: East component in nT
+        vertical_component: Vertical component (down positive) in nT
+        horizontal_intensity: Horizontal intensity in nT
+        total_intensity: Total intensity in nT
+    """
+
+    declination: np.ndarray
+    inclination: np.ndarray
+    north_component: np.ndarray
+    east_component: np.ndarray
+    vertical_component: np.ndarray
+    horizontal_intensity: np.ndarray
+    total_intensity: np.ndarray
+
+
+class GeoMagColumns(NamedTuple):
+    """Full magnetic field results for a batch of points, one array per field.
+
+    Attributes mirror GeoMagResult. Each is a contiguous array with the
+    broadcast shape of the inputs passed to GeoMag.calculate_columns:
+    float64 for the values and bool for the warning zone flags.
+    """
+
+    time: np.ndarray
+    alt: np.ndarray
+    glat: np.ndarray
+    glon: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+    h: np.ndarray
+    f: np.ndarray
+    i: np.ndarray
+    d: np.ndarray
+    gv: np.ndarray
+    in_blackout_zone: np.ndarray
+    in_caution_zone: np.ndarray
+    is_high_resolution: np.ndarray
+
+
 class GeoMagUncertainty(ctypes.Structure):
     """Uncertainty result structure.
 
@@ -117,23 +244,46 @@ class GeoMagUncertainty(ctypes.Structure):
         )
 
 
+class _GeoMagResultColumns(ctypes.Structure):
+    """Output column pointers for geomag_calculate_many_soa."""
+
+    _fields_ = [
+        (name, ctypes.POINTER(ctypes.c_bool if ctype is ctypes.c_bool else ctypes.c_double))
+        for name, ctype in GeoMagResult._fields_
+    ]
+
+
 class _GeoMagInternal(ctypes.Structure):
-    """Internal C structure - not exposed to users."""
+    """Internal C structure - not exposed to users.
+
+    The coefficient arrays are allocated by geomag_init and released by
+    geomag_free; only their pointers live in this structure.
+    """
 
-    WMM_MAX_SIZE = 134
     _fields_ = [
         ("maxord", ctypes.c_int),
         ("size", ctypes.c_int),
         ("epoch", ctypes.c_double),
         ("model", ctypes.c_char * 32),
         ("release_date", ctypes.c_char * 16),
-        # Full coefficient arrays - required for proper memory allocation
-        ("c", ctypes.c_double * WMM_MAX_SIZE * WMM_MAX_SIZE),
-        ("cd", ctypes.c_double * WMM_MAX_SIZE * WMM_MAX_SIZE),
-        ("k", ctypes.c_double * WMM_MAX_SIZE * WMM_MAX_SIZE),
-        ("fn", ctypes.c_double * WMM_MAX_SIZE),
-        ("fm", ctypes.c_double * WMM_MAX_SIZE),
-        ("p", ctypes.c_double * (WMM_MAX_SIZE * WMM_MAX_SIZE)),
+        ("block", ctypes.POINTER(ctypes.c_double)),
+        ("g", ctypes.POINTER(ctypes.c_double)),
+        ("h", ctypes.POINTER(ctypes.c_double)),
+        ("dg", ctypes.POINTER(ctypes.c_double)),
+        ("dh", ctypes.POINTER(ctypes.c_double)),
+        ("k", ctypes.POINTER(ctypes.c_double)),
+    ]
+
+
+class _GeoMagTime(ctypes.Structure):
+    """Internal C structure for coefficients prepared at one time."""
+
+    _fields_ = [
+        ("time", ctypes.c_double),
+        ("size", ctypes.c_int),
+        ("block", ctypes.POINTER(ctypes.c_double)),
+        ("g", ctypes.POINTER(ctypes.c_double)),
+        ("h", ctypes.POINTER(ctypes.c_double)),
     ]
 
 
@@ -143,50 +293,91 @@ class GeoMag:
     This class provides a high-level interface to the WMM C library for calculating
     Earth's magnetic field components at any location and time.
 
+    Call close() when done with a model, or use it as a context manager.
+
     Examples:
         >>> # Use bundled standard WMM model (most common)
         >>> gm = GeoMag()
         >>> result = gm.calculate(lat=47.6205, lon=-122.3493, alt=0, time=2025.5)
         >>> print(f"Declination: {result.declination:.2f}°")
         >>>
-        >>> # Use bundled high-resolution model
-        >>> gm_hr = GeoMag(high_resolution=True)
+        >>> # Use bundled high-resolution model, released on leaving the block
+        >>> with GeoMag(high_resolution=True) as gm_hr:
+        ...     result = gm_hr.calculate(47.6205, -122.3493, 0, 2025.5)
     """
 
     _lib = None
     _lib_path = None
+    _c_calculate_raw = None
+
+    # Parsed models by (absolute path, high_resolution, device, inode, mtime,
+    # size), copied into new instances instead of re-reading the coefficient
+    # file. The least recently used models beyond _models_max are freed. The
+    # C calls below release the GIL, so the lock keeps one thread from freeing
+    # a cached model while another is still copying from it.
+    _models = OrderedDict()
+    _models_max = 4
+    _models_lock = threading.Lock()
 
     @classmethod
     def _load_library(cls):
-        """Load the shared library."""
+        """Load the shared library.
+
+        ``GEOMAG_LIB_PATH`` names the library file to try first; the
+        directory search only runs when it is unset or does not load, and
+        the rejected path is reported with a RuntimeWarning.
+        """
         if cls._lib is not None:
             return cls._lib
 
+        env_path = os.environ.get("GEOMAG_LIB_PATH")
+        if env_path:
+            if cls._try_load(Path(env_path)):
+                return cls._lib
+            warnings.warn(
+                f"GEOMAG_LIB_PATH={env_path!r} could not be loaded as the geomag "
+                "library; falling back to the library search",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+
         # Try to find the library
         lib_name = _get_library_name()
         search_paths = _get_library_search_paths()
 
         for path in search_paths:
             lib_path = path / lib_name
-            if lib_path.exists():
-                try:
-                    cls._lib = ctypes.CDLL(str(lib_path))
-                    cls._lib_path = lib_path
-                    _setup_library_functions(cls._lib)
-                    return cls._lib
-                except OSError:
-                    continue
+            if lib_path.exists() and cls._try_load(lib_path):
+                return cls._lib
 
         raise RuntimeError(
             f"Could not find geomag library. Searched: {search_paths}\n"
             "Please build the library first with 'make' or install the package."
         )
 
-    def __init__(self, coefficients_file: str = None, high_resolution: bool = False):
+    @classmethod
+    def _try_load(cls, lib_path: Path) -> bool:
+        """Load and set up the library at lib_path, returning False on failure.
+
+        A library that loads but lacks an entry point (e.g. an older build)
+        also counts as a failure, so the caller moves on to the next path.
+        """
+        try:
+            lib = ctypes.CDLL(str(lib_path), mode=_LIBRARY_LOAD_MODE)
+            _setup_library_functions(lib)
+        except (OSError, AttributeError):
+            return False
+        cls._lib = lib
+        cls._lib_path = lib_path
+        cls._c_calculate_raw = _raw_calculate_function(lib)
+        return True
+
+    def __init__(self, coefficients_file=None, high_resolution: bool = False):
         """Initialize a GeoMag model.
 
         Args:
-            coefficients_file: Optional path to a WMM coefficient file (.COF).
+            coefficients_file: Optional path to a WMM coefficient file (.COF), as str,
+                              bytes or os.PathLike.
                               If None, uses bundled WMM.COF (standard) or WMMHR.COF (high-res).
             high_resolution: Use high resolution model (133 degrees) if True.
                            Only used when coefficients_file is None.
@@ -208,6 +399,18 @@ class GeoMag:
         self._lib = self._load_library()
         self._geo_mag = _GeoMagInternal()  # Allocate proper structure
 
+        # Bind the C entry points and the model reference once, so per-point
+        # calls skip the attribute lookups through self._lib
+        self._geo_mag_ref = ctypes.byref(self._geo_mag)
+        self._geo_mag_addr = ctypes.addressof(self._geo_mag)
+        self._c_calc = self._lib.geomag_calculate
+        self._c_unc = self._lib.geomag_calculate_uncertainty
+        self._c_free = self._lib.geomag_free
+
+        # Result buffer reused by calculate(..., copy=False)
+        self._scratch_result = GeoMagResult()
+        self._scratch_result_ref = ctypes.byref(self._scratch_result)
+
         # If no file specified, use bundled data files
         if coefficients_file is None:
             package_dir = Path(__file__).parent
@@ -216,27 +419,72 @@ class GeoMag:
             else:
                 coefficients_file = str(package_dir / "data" / "WMM.COF")
 
-        # Convert path to bytes
-        if not os.path.exists(coefficients_file):
+        # One stat both checks that the file exists and identifies its
+        # current contents for the parsed-model cache
+        coef_file_bytes = os.fsencode(coefficients_file)
+        try:
+            stat = os.stat(coef_file_bytes)
+        except OSError:
             raise FileNotFoundError(
                 f"Coefficients file not found: {coefficients_file}\n"
                 f"If using bundled data, ensure the package is installed correctly."
-            )
+            ) from None
+
+        # The absolute path keeps relative names apart across os.chdir, and
+        # the device and inode catch a file replaced with the same mtime and size
+        cache_key = (
+            os.path.abspath(coef_file_bytes),
+            bool(high_resolution),
+            stat.st_dev,
+            stat.st_ino,
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+        with self._models_lock:
+            cached = self._models.get(cache_key)
+            if cached is not None:
+                self._models.move_to_end(cache_key)
+            else:
+                cached = _GeoMagInternal()
+                ret = self._lib.geomag_init(ctypes.byref(cached), coef_file_bytes, high_resolution)
 
-        coef_file_bytes = coefficients_file.encode("utf-8")
+                if ret != 0:
+                    raise RuntimeError(f"Failed to initialize GeoMag from {coefficients_file}")
 
-        ret = self._lib.geomag_init(
-            ctypes.byref(self._geo_mag), coef_file_bytes, high_resolution
-        )
+                # Drop models parsed from earlier versions of the same file; live
+                # instances hold their own copies
+                stale = [
+                    key for key in self._models if key[:2] == cache_key[:2] and key != cache_key
+                ]
+                for key in stale:
+                    self._lib.geomag_free(ctypes.byref(self._models.pop(key)))
+                self._models[cache_key] = cached
 
-        if ret != 0:
-            raise RuntimeError(f"Failed to initialize GeoMag from {coefficients_file}")
+                while len(self._models) > self._models_max:
+                    _, evicted = self._models.popitem(last=False)
+                    self._lib.geomag_free(ctypes.byref(evicted))
+
+            if self._lib.geomag_copy(self._geo_mag_ref, ctypes.byref(cached)) != 0:
+                raise MemoryError("Failed to allocate GeoMag coefficients")
 
         # Extract model info directly from the structure
         self.model = self._geo_mag.model.decode("utf-8")
         self.epoch = self._geo_mag.epoch
         self.release_date = self._geo_mag.release_date.decode("utf-8")
         self.maxord = self._geo_mag.maxord
+        self._closed = False
+
+    @classmethod
+    def clear_cache(cls):
+        """Free every parsed model kept for reuse by new instances.
+
+        Open instances are unaffected, as each holds its own copy of the
+        coefficients; the next GeoMag for a file parses it again.
+        """
+        with cls._models_lock:
+            while cls._models:
+                _, model = cls._models.popitem()
+                cls._lib.geomag_free(ctypes.byref(model))
 
     def calculate(
         self,
@@ -246,9 +494,19 @@ class GeoMag:
         time: float,
         allow_date_outside_lifespan: bool = False,
         raise_in_warning_zone: bool = False,
+        copy: bool = True,
     ) -> GeoMagResult:
         """Calculate magnetic field values.
 
+        Arguments can be passed positionally in the order listed below, which
+        is the cheaper form when calling in a tight loop.
+
+        With ``copy=False`` the result is written into a buffer owned by this
+        GeoMag instance instead of a new GeoMagResult. The same object is
+        returned, and overwritten, by every such call, so read what you need
+        (or use ``to_namedtuple()``) before the next one, and do not share the
+        instance across threads on this path.
+
         Args:
             lat: Geodetic latitude in degrees (-90 to +90, North positive)
             lon: Geodetic longitude in degrees (-180 to +180, East positive)
@@ -256,6 +514,7 @@ class GeoMag:
             time: Time in decimal year (e.g., 2025.5 for mid-2025)
             allow_date_outside_lifespan: Allow dates outside 5-year model span
             raise_in_warning_zone: Raise exception for blackout/caution zones
+            copy: Return a new GeoMagResult (True) or the shared scratch result (False)
 
         Returns:
             GeoMagResult with magnetic field components
@@ -263,27 +522,320 @@ class GeoMag:
         Raises:
             RuntimeError: If calculation fails or in warning zone (if raise_in_warning_zone=True)
         """
-        result = GeoMagResult()
+        if copy:
+            result = GeoMagResult()
+            result_ref = ctypes.byref(result)
+        else:
+            result = self._scratch_result
+            result_ref = self._scratch_result_ref
+
+        if _geomag_fast is not None:
+            # Typed Cython binding, when the package was built with USE_CYTHON=1
+            ret = _geomag_fast.calculate(
+                self._geo_mag_addr,
+                lat,
+                lon,
+                alt,
+                time,
+                allow_date_outside_lifespan,
+                raise_in_warning_zone,
+                result,
+            )
+        else:
+            # argtypes declares c_double for the scalars, so ctypes converts the
+            # Python floats itself without temporary c_double objects
+            ret = self._c_calc(
+                self._geo_mag_ref,
+                lat,
+                lon,
+                alt,
+                time,
+                allow_date_outside_lifespan,
+                raise_in_warning_zone,
+                result_ref,
+            )
+
+        _check_calculate_status(ret)
+
+        return result
 
-        ret = self._lib.geomag_calculate(
-            ctypes.byref(self._geo_mag),
-            ctypes.c_double(lat),
-            ctypes.c_double(lon),
-            ctypes.c_double(alt),
-            ctypes.c_double(time),
+    def calculate_batch(
+        self,
+        lats,
+        lons,
+        alts,
+        times,
+        allow_date_outside_lifespan: bool = False,
+        raise_in_warning_zone: bool = False,
+        workers: int = 1,
+    ) -> GeoMagBatchResult:
+        """Calculate magnetic field values for many points in one C call.
+
+        The inputs are broadcast against each other, so scalars can be mixed
+        with arrays (e.g. a single altitude and time for a list of locations).
+        The whole batch is evaluated by the C library without returning to
+        Python between points, and without holding the GIL. If the library
+        was built with OpenMP (``make OPENMP=1``) the points are also split
+        across cores; ``OMP_NUM_THREADS`` controls how many.
+
+        Without OpenMP, ``workers`` splits the batch into that many
+        contiguous chunks evaluated from a thread pool. The C calls run
+        without the GIL, so the chunks proceed in parallel; pass
+        ``os.cpu_count()`` to use every core. Leave it at 1 for OpenMP builds
+        to avoid oversubscribing the cores.
+
+        Consecutive points with the same latitude and altitude reuse the
+        Legendre function tables, so grids are fastest with longitude varying
+        along the last axis (e.g. ``lats[:, None]`` against ``lons[None, :]``).
+
+        Args:
+            lats: Geodetic latitudes in degrees (-90 to +90, North positive)
+            lons: Geodetic longitudes in degrees (-180 to +180, East positive)
+            alts: Altitudes in km (-1 to 850, referenced to WGS84 ellipsoid)
+            times: Times in decimal year (e.g., 2025.5 for mid-2025)
+            allow_date_outside_lifespan: Allow dates outside 5-year model span
+            raise_in_warning_zone: Raise exception for blackout/caution zones
+            workers: Number of threads to split the batch across
+
+        Returns:
+            GeoMagBatchResult with one array per magnetic field component
+
+        Raises:
+            RuntimeError: If calculation fails for any point or any point is in
+                a warning zone (if raise_in_warning_zone=True)
+
+        Examples:
+            >>> gm = GeoMag()
+            >>> res = gm.calculate_batch([47.6205, 40.7128], [-122.3493, -74.0060], 0.0, 2025.5)
+            >>> res.declination.shape
+            (2,)
+        """
+        shape, (lats, lons, alts, times) = _point_arrays(lats, lons, alts, times)
+        outputs = [
+            np.empty(lats.size, dtype=np.float64) for _ in GeoMagBatchResult._fields
+        ]
+
+        def run(lats, lons, alts, times, *outputs):
+            return self._lib.geomag_calculate_batch(
+                self._geo_mag_ref,
+                lats,
+                lons,
+                alts,
+                times,
+                lats.size,
+                allow_date_outside_lifespan,
+                raise_in_warning_zone,
+                *outputs,
+            )
+
+        ret = _run_in_chunks(run, (lats, lons, alts, times), outputs, workers)
+
+        _check_calculate_status(ret)
+
+        return GeoMagBatchResult(*(out.reshape(shape) for out in outputs))
+
+    def grid(
+        self,
+        lats,
+        lons,
+        alt: float,
+        time: float,
+        allow_date_outside_lifespan: bool = False,
+        raise_in_warning_zone: bool = False,
+        workers: int = 1,
+    ) -> GeoMagBatchResult:
+        """Calculate magnetic field values on a latitude/longitude grid.
+
+        Evaluates every combination of the 1-D ``lats`` and ``lons`` at one
+        altitude and time. Longitude varies fastest, so each grid row reuses
+        the Legendre tables of its latitude, and the coefficients are adjusted
+        to ``time`` once for the whole grid (see prepare). ``workers``
+        threads share the grid as in calculate_batch.
+
+        Args:
+            lats: 1-D geodetic latitudes in degrees (-90 to +90, North positive)
+            lons: 1-D geodetic longitudes in degrees (-180 to +180, East positive)
+            alt: Altitude in km (-1 to 850, referenced to WGS84 ellipsoid)
+            time: Time in decimal year (e.g., 2025.5 for mid-2025)
+            allow_date_outside_lifespan: Allow dates outside 5-year model span
+            raise_in_warning_zone: Raise exception for blackout/caution zones
+            workers: Number of threads to split the grid across
+
+        Returns:
+            GeoMagBatchResult whose arrays have shape ``(len(lats), len(lons))``
+
+        Raises:
+            RuntimeError: If calculation fails for any grid point or any point
+                is in a warning zone (if raise_in_warning_zone=True)
+
+        Examples:
+            >>> gm = GeoMag()
+            >>> res = gm.grid(np.arange(-80, 81, 10), np.arange(-180, 180, 10), 0.0, 2025.5)
+            >>> res.declination.shape
+            (17, 36)
+        """
+        lats = np.asarray(lats, dtype=np.float64).ravel()
+        lons = np.asarray(lons, dtype=np.float64).ravel()
+        if np.ndim(time) != 0:
+            return self.calculate_batch(
+                lats[:, None],
+                lons[None, :],
+                alt,
+                time,
+                allow_date_outside_lifespan,
+                raise_in_warning_zone,
+                workers,
+            )
+
+        # One time for the whole grid: adjust the coefficients to it once
+        with self.prepare(time, allow_date_outside_lifespan) as prepared:
+            return prepared.calculate_batch(
+                lats[:, None], lons[None, :], alt, raise_in_warning_zone, workers
+            )
+
+    def calculate_many(
+        self,
+        lats,
+        lons,
+        alts,
+        times,
+        allow_date_outside_lifespan: bool = False,
+        raise_in_warning_zone: bool = False,
+    ) -> np.ndarray:
+        """Calculate full magnetic field results for many points in one C call.
+
+        Inputs are broadcast like calculate_batch, but each point gets every
+        GeoMagResult field, including grid variation and the warning zone
+        flags. Prefer calculate_batch when only the field components are
+        needed.
+
+        Args:
+            lats: Geodetic latitudes in degrees (-90 to +90, North positive)
+            lons: Geodetic longitudes in degrees (-180 to +180, East positive)
+            alts: Altitudes in km (-1 to 850, referenced to WGS84 ellipsoid)
+            times: Times in decimal year (e.g., 2025.5 for mid-2025)
+            allow_date_outside_lifespan: Allow dates outside 5-year model span
+            raise_in_warning_zone: Raise exception for blackout/caution zones
+
+        Returns:
+            Structured array of RESULT_DTYPE with the broadcast shape of the
+            inputs. Each field (e.g. ``res["d"]``, ``res["gv"]``) is a strided
+            view without copying; use ``np.ascontiguousarray(res["d"])`` for a
+            packed copy, or calculate_columns to get packed arrays directly.
+
+        Raises:
+            RuntimeError: If calculation fails for any point or any point is in
+                a warning zone (if raise_in_warning_zone=True)
+
+        Examples:
+            >>> gm = GeoMag()
+            >>> res = gm.calculate_many([47.6205, 80.0], [-122.3493, 100.0], 0.0, 2025.5)
+            >>> res["gv"].shape
+            (2,)
+        """
+        shape, (lats, lons, alts, times) = _point_arrays(lats, lons, alts, times)
+        results = np.empty(lats.size, dtype=RESULT_DTYPE)
+
+        ret = self._lib.geomag_calculate_many(
+            self._geo_mag_ref,
+            lats,
+            lons,
+            alts,
+            times,
+            lats.size,
             allow_date_outside_lifespan,
             raise_in_warning_zone,
-            ctypes.byref(result),
+            results,
         )
 
-        if ret == -1:
-            raise RuntimeError("Failed to calculate magnetic field")
-        elif ret == -2:
-            raise RuntimeError("Location is in blackout zone (H < 2000 nT)")
-        elif ret == -3:
-            raise RuntimeError("Location is in caution zone (2000 <= H < 6000 nT)")
+        _check_calculate_status(ret)
 
-        return result
+        return results.reshape(shape)
+
+    def calculate_columns(
+        self,
+        lats,
+        lons,
+        alts,
+        times,
+        allow_date_outside_lifespan: bool = False,
+        raise_in_warning_zone: bool = False,
+    ) -> GeoMagColumns:
+        """Calculate full magnetic field results for many points as columns.
+
+        Same inputs and results as calculate_many, but each GeoMagResult
+        field is returned as its own contiguous array instead of one
+        structured array. Prefer this when results are consumed field by
+        field (e.g. ``np.mean(res.d)``).
+
+        Args:
+            lats: Geodetic latitudes in degrees (-90 to +90, North positive)
+            lons: Geodetic longitudes in degrees (-180 to +180, East positive)
+            alts: Altitudes in km (-1 to 850, referenced to WGS84 ellipsoid)
+            times: Times in decimal year (e.g., 2025.5 for mid-2025)
+            allow_date_outside_lifespan: Allow dates outside 5-year model span
+            raise_in_warning_zone: Raise exception for blackout/caution zones
+
+        Returns:
+            GeoMagColumns with one array per GeoMagResult field
+
+        Raises:
+            RuntimeError: If calculation fails for any point or any point is in
+                a warning zone (if raise_in_warning_zone=True)
+        """
+        shape, (lats, lons, alts, times) = _point_arrays(lats, lons, alts, times)
+        outputs = [
+            np.empty(lats.size, dtype=np.bool_ if ctype is ctypes.c_bool else np.float64)
+            for _, ctype in GeoMagResult._fields_
+        ]
+        columns = _GeoMagResultColumns(
+            *(
+                out.ctypes.data_as(pointer_type)
+                for out, (_, pointer_type) in zip(outputs, _GeoMagResultColumns._fields_)
+            )
+        )
+
+        ret = self._lib.geomag_calculate_many_soa(
+            self._geo_mag_ref,
+            lats,
+            lons,
+            alts,
+            times,
+            lats.size,
+            allow_date_outside_lifespan,
+            raise_in_warning_zone,
+            ctypes.byref(columns),
+        )
+
+        _check_calculate_status(ret)
+
+        return GeoMagColumns(*(out.reshape(shape) for out in outputs))
+
+    def prepare(
+        self, time: float, allow_date_outside_lifespan: bool = False
+    ) -> "PreparedGeoMag":
+        """Adjust the model to one time for repeated calculations at that time.
+
+        The secular variation update is then done once instead of for every
+        point, which helps snapshots such as grids or a fixed-time list of
+        locations. Results are the same as calculating at ``time`` directly.
+
+        Args:
+            time: Time in decimal year (e.g., 2025.5 for mid-2025)
+            allow_date_outside_lifespan: Allow dates outside 5-year model span
+
+        Returns:
+            PreparedGeoMag, to be closed (or used as a context manager)
+
+        Raises:
+            RuntimeError: If time is outside the model lifespan (unless allowed)
+
+        Examples:
+            >>> gm = GeoMag()
+            >>> with gm.prepare(2025.5) as snapshot:
+            ...     res = snapshot.calculate(47.6205, -122.3493, 0.0)
+        """
+        return PreparedGeoMag(self, time, allow_date_outside_lifespan)
 
     def calculate_uncertainty(self, result: GeoMagResult) -> GeoMagUncertainty:
         """Calculate uncertainty estimates for a result.
@@ -299,31 +851,255 @@ class GeoMag:
         """
         uncertainty = GeoMagUncertainty()
 
-        ret = self._lib.geomag_calculate_uncertainty(
-            ctypes.byref(result), ctypes.byref(uncertainty)
-        )
+        ret = self._c_unc(ctypes.byref(result), ctypes.byref(uncertainty))
 
         if ret != 0:
             raise RuntimeError("Failed to calculate uncertainty")
 
         return uncertainty
 
+    @property
+    def c_calculate_ptr(self):
+        """geomag_calculate as a ctypes function taking plain addresses.
+
+        Unlike the bound ctypes function, the model and result arguments are
+        declared as ``void *``, which is what Numba supports when calling
+        ctypes functions from nopython code. Pass ``internal_ptr`` as the
+        model and the address of a GeoMagResult-sized slot as the result::
+
+            calc, gm_ptr = gm.c_calculate_ptr, gm.internal_ptr
+            size = ctypes.sizeof(GeoMagResult)
+
+            @numba.njit
+            def run(lats, lons, alt, time, out):
+                # out = np.empty(n, dtype=RESULT_DTYPE)
+                for j in range(lats.size):
+                    calc(gm_ptr, lats[j], lons[j], alt, time, False, False,
+                         out.ctypes.data + j * size)
+
+        The return value is the geomag_calculate status code.
+        """
+        return self._c_calculate_raw
+
+    @property
+    def internal_ptr(self) -> int:
+        """Address of the C model structure, for use with c_calculate_ptr.
+
+        Only valid while this GeoMag instance is alive.
+        """
+        return ctypes.addressof(self._geo_mag)
+
+    def close(self):
+        """Release the C resources of this model.
+
+        Calculations on a closed model raise RuntimeError. Calling close
+        more than once is harmless.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._c_free(self._geo_mag_ref)
+        # Later calls pass NULL, which the C library rejects
+        self._geo_mag_ref = None
+        self._geo_mag_addr = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def __del__(self):
-        """Clean up resources."""
-        if (
-            hasattr(self, "_lib")
-            and self._lib is not None
-            and hasattr(self, "_geo_mag")
-        ):
-            try:
-                self._lib.geomag_free(ctypes.byref(self._geo_mag))
-            except Exception:
-                pass
+        """Best-effort cleanup for models that were never closed."""
+        if getattr(self, "_closed", True):
+            return
+        try:
+            # Close first: the warning raises when ResourceWarning is an error
+            self.close()
+            warnings.warn(f"unclosed {self!r}", ResourceWarning, source=self)
+        except Exception:
+            # Module globals may already be gone at interpreter shutdown
+            pass
 
     def __repr__(self) -> str:
         return f"GeoMag(model='{self.model}', epoch={self.epoch})"
 
 
+class PreparedGeoMag:
+    """GeoMag model with its coefficients adjusted to one time.
+
+    Created by GeoMag.prepare. Calculations take no time argument and give
+    the same results as the GeoMag methods at that time. The GeoMag it was
+    prepared from must stay open while this object is used.
+    """
+
+    def __init__(self, geo_mag: GeoMag, time: float, allow_date_outside_lifespan: bool = False):
+        self._geo_mag = geo_mag
+        self._lib = geo_mag._lib
+        self._prepared = _GeoMagTime()
+        self._prepared_ref = ctypes.byref(self._prepared)
+
+        ret = self._lib.geomag_prepare_time(
+            geo_mag._geo_mag_ref, time, allow_date_outside_lifespan, self._prepared_ref
+        )
+
+        if ret != 0:
+            raise RuntimeError(f"Failed to prepare {geo_mag!r} for time {time}")
+
+        self.time = time
+        self._closed = False
+
+    def calculate(
+        self, lat: float, lon: float, alt: float, raise_in_warning_zone: bool = False
+    ) -> GeoMagResult:
+        """Calculate magnetic field values at the prepared time.
+
+        Args:
+            lat: Geodetic latitude in degrees (-90 to +90, North positive)
+            lon: Geodetic longitude in degrees (-180 to +180, East positive)
+            alt: Altitude in km (-1 to 850, referenced to WGS84 ellipsoid)
+            raise_in_warning_zone: Raise exception for blackout/caution zones
+
+        Returns:
+            GeoMagResult with magnetic field components
+
+        Raises:
+            RuntimeError: If calculation fails or in warning zone (if raise_in_warning_zone=True)
+        """
+        result = GeoMagResult()
+
+        ret = self._lib.geomag_calculate_prepared(
+            self._geo_mag._geo_mag_ref,
+            self._prepared_ref,
+            lat,
+            lon,
+            alt,
+            raise_in_warning_zone,
+            ctypes.byref(result),
+        )
+
+        _check_calculate_status(ret)
+
+        return result
+
+    def calculate_batch(
+        self, lats, lons, alts, raise_in_warning_zone: bool = False, workers: int = 1
+    ) -> GeoMagBatchResult:
+        """Calculate magnetic field values for many points at the prepared time.
+
+        Inputs are broadcast, and ``workers`` threads share the batch, like
+        GeoMag.calculate_batch.
+
+        Args:
+            lats: Geodetic latitudes in degrees (-90 to +90, North positive)
+            lons: Geodetic longitudes in degrees (-180 to +180, East positive)
+            alts: Altitudes in km (-1 to 850, referenced to WGS84 ellipsoid)
+            raise_in_warning_zone: Raise exception for blackout/caution zones
+            workers: Number of threads to split the batch across
+
+        Returns:
+            GeoMagBatchResult with one array per magnetic field component
+
+        Raises:
+            RuntimeError: If calculation fails for any point or any point is in
+                a warning zone (if raise_in_warning_zone=True)
+        """
+        shape, (lats, lons, alts) = _point_arrays(lats, lons, alts)
+        outputs = [
+            np.empty(lats.size, dtype=np.float64) for _ in GeoMagBatchResult._fields
+        ]
+
+        def run(lats, lons, alts, *outputs):
+            return self._lib.geomag_calculate_batch_prepared(
+                self._geo_mag._geo_mag_ref,
+                self._prepared_ref,
+                lats,
+                lons,
+                alts,
+                lats.size,
+                raise_in_warning_zone,
+                *outputs,
+            )
+
+        ret = _run_in_chunks(run, (lats, lons, alts), outputs, workers)
+
+        _check_calculate_status(ret)
+
+        return GeoMagBatchResult(*(out.reshape(shape) for out in outputs))
+
+    def close(self):
+        """Release the prepared coefficients. Calling close more than once is harmless."""
+        if self._closed:
+            return
+        self._closed = True
+        self._lib.geomag_free_time(self._prepared_ref)
+        # Later calls pass NULL, which the C library rejects
+        self._prepared_ref = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        """Best-effort cleanup for prepared models that were never closed."""
+        if getattr(self, "_closed", True):
+            return
+        try:
+            # Close first: the warning raises when ResourceWarning is an error
+            self.close()
+            warnings.warn(f"unclosed {self!r}", ResourceWarning, source=self)
+        except Exception:
+            # Module globals may already be gone at interpreter shutdown
+            pass
+
+    def __repr__(self) -> str:
+        return f"PreparedGeoMag(model='{self._geo_mag.model}', time={self.time})"
+
+
+def _point_arrays(*values):
+    """Broadcast per-point inputs to a common shape, as flat contiguous float64 arrays.
+
+    Returns the broadcast shape and the flattened arrays.
+    """
+    arrays = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in values))
+    return arrays[0].shape, [np.ascontiguousarray(v).ravel() for v in arrays]
+
+
+def _run_in_chunks(run, inputs, outputs, workers: int) -> int:
+    """Call run(*inputs, *outputs) over contiguous slices from a thread pool.
+
+    The slices are views, so each call writes straight into its part of the
+    outputs. Returns the status of the first failing slice, in point order,
+    so errors match a single call over the whole batch.
+    """
+    n = inputs[0].size
+    workers = max(1, min(int(workers), n))
+    if workers == 1:
+        return run(*inputs, *outputs)
+
+    bounds = np.linspace(0, n, workers + 1).astype(np.intp)
+
+    def run_slice(start, stop):
+        return run(*(a[start:stop] for a in inputs), *(o[start:stop] for o in outputs))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        statuses = list(pool.map(run_slice, bounds[:-1], bounds[1:]))
+
+    return next((ret for ret in statuses if ret != 0), 0)
+
+
+def _check_calculate_status(ret: int):
+    """Raise the exception matching a geomag_calculate return code."""
+    if ret == -1:
+        raise RuntimeError("Failed to calculate magnetic field")
+    elif ret == -2:
+        raise RuntimeError("Location is in blackout zone (H < 2000 nT)")
+    elif ret == -3:
+        raise RuntimeError("Location is in caution zone (2000 <= H < 6000 nT)")
+
+
 def _get_library_name() -> str:
     """Get the platform-specific library name."""
     system = platform.system()
@@ -335,6 +1111,11 @@ def _get_library_name() -> str:
         return "libgeomag.so"
 
 
+# Resolve every symbol when the library is loaded rather than on first call,
+# and keep them out of the global namespace (no-op flags on Windows)
+_LIBRARY_LOAD_MODE = getattr(os, "RTLD_NOW", 0) | ctypes.RTLD_LOCAL
+
+
 def _get_library_search_paths() -> list:
     """Get list of paths to search for the library."""
     paths = []
@@ -371,36 +1152,177 @@ def _get_library_search_paths() -> list:
     return paths
 
 
+# Contiguous float64 array arguments for the batch entry points
+_DOUBLE_ARRAY_IN = np.ctypeslib.ndpointer(dtype=np.float64, ndim=1, flags="C_CONTIGUOUS")
+_DOUBLE_ARRAY_OUT = np.ctypeslib.ndpointer(
+    dtype=np.float64, ndim=1, flags=("C_CONTIGUOUS", "WRITEABLE")
+)
+
+# Structure pointer argument types, built once for every library handle
+_GEOMAG_PTR = ctypes.POINTER(_GeoMagInternal)
+_RESULT_PTR = ctypes.POINTER(GeoMagResult)
+_UNCERTAINTY_PTR = ctypes.POINTER(GeoMagUncertainty)
+_TIME_PTR = ctypes.POINTER(_GeoMagTime)
+_COLUMNS_PTR = ctypes.POINTER(_GeoMagResultColumns)
+
+# Array of GeoMagResult structures
+_RESULT_ARRAY_OUT = np.ctypeslib.ndpointer(
+    dtype=RESULT_DTYPE, ndim=1, flags=("C_CONTIGUOUS", "WRITEABLE")
+)
+
+
+# geomag_calculate with pointer arguments declared as void *
+_RAW_CALCULATE_TYPE = ctypes.CFUNCTYPE(
+    ctypes.c_int,
+    ctypes.c_void_p,  # geo_mag
+    ctypes.c_double,  # glat
+    ctypes.c_double,  # glon
+    ctypes.c_double,  # alt
+    ctypes.c_double,  # time
+    ctypes.c_bool,  # allow_date_outside_lifespan
+    ctypes.c_bool,  # raise_in_warning_zone
+    ctypes.c_void_p,  # result
+)
+
+
+def _raw_calculate_function(lib):
+    """Return geomag_calculate with pointer arguments declared as void *."""
+    return _RAW_CALCULATE_TYPE(("geomag_calculate", lib))
+
+
 def _setup_library_functions(lib):
     """Set up function signatures for the C library."""
+    if lib.geomag_init.argtypes:
+        # Already set up for this library handle
+        return
+
     # geomag_init
     lib.geomag_init.argtypes = [
-        ctypes.POINTER(_GeoMagInternal),  # geo_mag
+        _GEOMAG_PTR,  # geo_mag
         ctypes.c_char_p,  # coefficients_file
         ctypes.c_bool,  # high_resolution
     ]
     lib.geomag_init.restype = ctypes.c_int
 
+    # geomag_copy
+    lib.geomag_copy.argtypes = [
+        _GEOMAG_PTR,  # dst
+        _GEOMAG_PTR,  # src
+    ]
+    lib.geomag_copy.restype = ctypes.c_int
+
     # geomag_calculate
     lib.geomag_calculate.argtypes = [
-        ctypes.POINTER(_GeoMagInternal),  # geo_mag
+        _GEOMAG_PTR,  # geo_mag
         ctypes.c_double,  # glat
         ctypes.c_double,  # glon
         ctypes.c_double,  # alt
         ctypes.c_double,  # time
         ctypes.c_bool,  # allow_date_outside_lifespan
         ctypes.c_bool,  # raise_in_warning_zone
-        ctypes.POINTER(GeoMagResult),  # result
+        _RESULT_PTR,  # result
     ]
     lib.geomag_calculate.restype = ctypes.c_int
 
+    # geomag_calculate_batch
+    lib.geomag_calculate_batch.argtypes = [
+        _GEOMAG_PTR,  # geo_mag
+        _DOUBLE_ARRAY_IN,  # glat
+        _DOUBLE_ARRAY_IN,  # glon
+        _DOUBLE_ARRAY_IN,  # alt
+        _DOUBLE_ARRAY_IN,  # time
+        ctypes.c_size_t,  # n
+        ctypes.c_bool,  # allow_date_outside_lifespan
+        ctypes.c_bool,  # raise_in_warning_zone
+        _DOUBLE_ARRAY_OUT,  # d
+        _DOUBLE_ARRAY_OUT,  # i
+        _DOUBLE_ARRAY_OUT,  # x
+        _DOUBLE_ARRAY_OUT,  # y
+        _DOUBLE_ARRAY_OUT,  # z
+        _DOUBLE_ARRAY_OUT,  # h
+        _DOUBLE_ARRAY_OUT,  # f
+    ]
+    lib.geomag_calculate_batch.restype = ctypes.c_int
+
+    # geomag_calculate_many
+    lib.geomag_calculate_many.argtypes = [
+        _GEOMAG_PTR,  # geo_mag
+        _DOUBLE_ARRAY_IN,  # glat
+        _DOUBLE_ARRAY_IN,  # glon
+        _DOUBLE_ARRAY_IN,  # alt
+        _DOUBLE_ARRAY_IN,  # time
+        ctypes.c_size_t,  # n
+        ctypes.c_bool,  # allow_date_outside_lifespan
+        ctypes.c_bool,  # raise_in_warning_zone
+        _RESULT_ARRAY_OUT,  # results
+    ]
+    lib.geomag_calculate_many.restype = ctypes.c_int
+
+    # geomag_calculate_many_soa
+    lib.geomag_calculate_many_soa.argtypes = [
+        _GEOMAG_PTR,  # geo_mag
+        _DOUBLE_ARRAY_IN,  # glat
+        _DOUBLE_ARRAY_IN,  # glon
+        _DOUBLE_ARRAY_IN,  # alt
+        _DOUBLE_ARRAY_IN,  # time
+        ctypes.c_size_t,  # n
+        ctypes.c_bool,  # allow_date_outside_lifespan
+        ctypes.c_bool,  # raise_in_warning_zone
+        _COLUMNS_PTR,  # columns
+    ]
+    lib.geomag_calculate_many_soa.restype = ctypes.c_int
+
+    # geomag_prepare_time
+    lib.geomag_prepare_time.argtypes = [
+        _GEOMAG_PTR,  # geo_mag
+        ctypes.c_double,  # time
+        ctypes.c_bool,  # allow_date_outside_lifespan
+        _TIME_PTR,  # prepared
+    ]
+    lib.geomag_prepare_time.restype = ctypes.c_int
+
+    # geomag_calculate_prepared
+    lib.geomag_calculate_prepared.argtypes = [
+        _GEOMAG_PTR,  # geo_mag
+        _TIME_PTR,  # prepared
+        ctypes.c_double,  # glat
+        ctypes.c_double,  # glon
+        ctypes.c_double,  # alt
+        ctypes.c_bool,  # raise_in_warning_zone
+        _RESULT_PTR,  # result
+    ]
+    lib.geomag_calculate_prepared.restype = ctypes.c_int
+
+    # geomag_calculate_batch_prepared
+    lib.geomag_calculate_batch_prepared.argtypes = [
+        _GEOMAG_PTR,  # geo_mag
+        _TIME_PTR,  # prepared
+        _DOUBLE_ARRAY_IN,  # glat
+        _DOUBLE_ARRAY_IN,  # glon
+        _DOUBLE_ARRAY_IN,  # alt
+        ctypes.c_size_t,  # n
+        ctypes.c_bool,  # raise_in_warning_zone
+        _DOUBLE_ARRAY_OUT,  # d
+        _DOUBLE_ARRAY_OUT,  # i
+        _DOUBLE_ARRAY_OUT,  # x
+        _DOUBLE_ARRAY_OUT,  # y
+        _DOUBLE_ARRAY_OUT,  # z
+        _DOUBLE_ARRAY_OUT,  # h
+        _DOUBLE_ARRAY_OUT,  # f
+    ]
+    lib.geomag_calculate_batch_prepared.restype = ctypes.c_int
+
+    # geomag_free_time
+    lib.geomag_free_time.argtypes = [_TIME_PTR]
+    lib.geomag_free_time.restype = None
+
     # geomag_calculate_uncertainty
     lib.geomag_calculate_uncertainty.argtypes = [
-        ctypes.POINTER(GeoMagResult),
-        ctypes.POINTER(GeoMagUncertainty),
+        _RESULT_PTR,
+        _UNCERTAINTY_PTR,
     ]
     lib.geomag_calculate_uncertainty.restype = ctypes.c_int
 
     # geomag_free
-    lib.geomag_free.argtypes = [ctypes.POINTER(_GeoMagInternal)]
+    lib.geomag_free.argtypes = [_GEOMAG_PTR]
     lib.geomag_free.restype = None
@@ -16,11 +16,13 @@
 #define GEOMAG_H
 
 #include <stdbool.h>
+#include <stddef.h>
 
 /* Model sizes */
 #define WMM_SIZE_STANDARD 12
 #define WMM_SIZE_HIGH_RESOLUTION 133
 #define WMM_MAX_SIZE 134  /* Maximum array size needed */
+#define WMM_MAX_TERMS (WMM_MAX_SIZE * (WMM_MAX_SIZE + 1) / 2)  /* Terms with m <= n < WMM_MAX_SIZE */
 
 /* Warning zones */
 #define BLACKOUT_ZONE 2000.0
@@ -77,6 +79,30 @@ typedef struct {
     double d;  /**< Uncertainty of Declination in degrees */
 } GeoMagUncertainty;
 
+/**
+ * @brief Output columns for geomag_calculate_many_soa
+ *
+ * One caller-provided array per GeoMagResult field (structure of arrays),
+ * each long enough for every point of the call.
+ */
+typedef struct {
+    double *time;
+    double *alt;
+    double *glat;
+    double *glon;
+    double *x;
+    double *y;
+    double *z;
+    double *h;
+    double *f;
+    double *i;
+    double *d;
+    double *gv;
+    bool *in_blackout_zone;
+    bool *in_caution_zone;
+    bool *is_high_resolution;
+} GeoMagResultColumns;
+
 /**
  * @brief Main GeoMag model structure
  */
@@ -88,18 +114,39 @@ typedef struct {
     char model[32];       /**< Model name (e.g., "WMM-2025") */
     char release_date[16]; /**< Release date */
 
-    /* Coefficient arrays */
-    double c[WMM_MAX_SIZE][WMM_MAX_SIZE];   /**< Gauss coefficients gnm */
-    double cd[WMM_MAX_SIZE][WMM_MAX_SIZE];  /**< Secular variation dgnm */
-    double k[WMM_MAX_SIZE][WMM_MAX_SIZE];   /**< Recursion factors */
-    double fn[WMM_MAX_SIZE];                 /**< n+1 values */
-    double fm[WMM_MAX_SIZE];                 /**< n values */
-    double p[WMM_MAX_SIZE * WMM_MAX_SIZE];  /**< Schmidt semi-normalized associated Legendre functions */
+    /* Coefficient arrays, packed by degree: term (n, m) is at index n * (n + 1) / 2 + m,
+     * so the terms of one degree are contiguous in the order they are summed.
+     * They hold size * (size + 1) / 2 terms and all live in one block allocated
+     * by geomag_init and released by geomag_free, each array starting on a
+     * 64-byte boundary. */
+    double *block;        /**< Allocation backing the arrays below */
+    double *g;            /**< Gauss coefficients gnm (unnormalized) */
+    double *h;            /**< Gauss coefficients hnm (unnormalized) */
+    double *dg;           /**< Secular variation dgnm */
+    double *dh;           /**< Secular variation dhnm */
+    double *k;            /**< Recursion factors */
 } GeoMag;
 
+/**
+ * @brief Gauss coefficients adjusted to one point in time
+ *
+ * Filled by geomag_prepare_time for repeated calculations at the same time
+ * (e.g. a grid snapshot), which then skip the secular variation update.
+ */
+typedef struct {
+    double time;          /**< Time in decimal year the coefficients are adjusted to */
+    int size;             /**< Size of the model they were prepared from */
+    double *block;        /**< Allocation backing g and h */
+    double *g;            /**< Time-adjusted gnm, packed like GeoMag.g */
+    double *h;            /**< Time-adjusted hnm, packed like GeoMag.h */
+} GeoMagTime;
+
 /**
  * @brief Initialize a GeoMag model from a coefficient file
  *
+ * The coefficient arrays are allocated here. Release them with geomag_free
+ * once the model is no longer needed; on error nothing is left allocated.
+ *
  * @param geo_mag Pointer to GeoMag structure to initialize
  * @param coefficients_file Path to the WMM coefficient file (.COF)
  * @param high_resolution Set to true for high resolution model (133 degrees)
@@ -107,9 +154,23 @@ typedef struct {
  */
 int geomag_init(GeoMag *geo_mag, const char *coefficients_file, bool high_resolution);
 
+/**
+ * @brief Initialize a GeoMag model as an independent copy of another
+ *
+ * Copies without re-reading the coefficient file. Free the copy with
+ * geomag_free like any initialized model.
+ *
+ * @param dst Pointer to GeoMag structure to initialize
+ * @param src Pointer to initialized GeoMag structure to copy
+ * @return 0 on success, -1 on error
+ */
+int geomag_copy(GeoMag *dst, const GeoMag *src);
+
 /**
  * @brief Calculate magnetic field values for a given location and time
  *
+ * The model is only read, so concurrent calls may share one GeoMag.
+ *
  * @param geo_mag Pointer to initialized GeoMag structure
  * @param glat Geodetic latitude in degrees (-90 to +90, North positive)
  * @param glon Geodetic longitude in degrees (-180 to +180, East positive)
@@ -124,6 +185,155 @@ int geomag_calculate(GeoMag *geo_mag, double glat, double glon, double alt, doub
                      bool allow_date_outside_lifespan, bool raise_in_warning_zone,
                      GeoMagResult *result);
 
+/**
+ * @brief Calculate magnetic field values for an array of points
+ *
+ * Evaluates geomag_calculate for each of the n points and stores the main
+ * field components in separate output arrays (structure of arrays), so that
+ * a whole batch costs a single call from a foreign-function interface.
+ * When the library is built with OpenMP the points are spread across
+ * threads. Points after the first failing one are skipped.
+ *
+ * @param geo_mag Pointer to initialized GeoMag structure
+ * @param glat Array of n geodetic latitudes in degrees
+ * @param glon Array of n geodetic longitudes in degrees
+ * @param alt Array of n altitudes in km
+ * @param time Array of n times in decimal year
+ * @param n Number of points
+ * @param allow_date_outside_lifespan Set to true to allow dates outside 5-year model span
+ * @param raise_in_warning_zone Set to true to return error codes for warning zones
+ * @param d Output array of n declinations in degrees
+ * @param i Output array of n inclinations in degrees
+ * @param x Output array of n North components in nT
+ * @param y Output array of n East components in nT
+ * @param z Output array of n Vertical components in nT
+ * @param h Output array of n horizontal intensities in nT
+ * @param f Output array of n total intensities in nT
+ * @return 0 on success, otherwise the geomag_calculate error code of the first failing point
+ */
+int geomag_calculate_batch(GeoMag *geo_mag, const double *glat, const double *glon,
+                           const double *alt, const double *time, size_t n,
+                           bool allow_date_outside_lifespan, bool raise_in_warning_zone,
+                           double *d, double *i, double *x, double *y, double *z,
+                           double *h, double *f);
+
+/**
+ * @brief Calculate full magnetic field results for an array of points
+ *
+ * Like geomag_calculate_batch, but stores the complete GeoMagResult of each
+ * point (including grid variation and warning zone flags) in one array.
+ * When the library is built with OpenMP the points are spread across
+ * threads. Points after the first failing one are skipped.
+ *
+ * @param geo_mag Pointer to initialized GeoMag structure
+ * @param glat Array of n geodetic latitudes in degrees
+ * @param glon Array of n geodetic longitudes in degrees
+ * @param alt Array of n altitudes in km
+ * @param time Array of n times in decimal year
+ * @param n Number of points
+ * @param allow_date_outside_lifespan Set to true to allow dates outside 5-year model span
+ * @param raise_in_warning_zone Set to true to return error codes for warning zones
+ * @param results Output array of n GeoMagResult structures
+ * @return 0 on success, otherwise the geomag_calculate error code of the first failing point
+ */
+int geomag_calculate_many(GeoMag *geo_mag, const double *glat, const double *glon,
+                          const double *alt, const double *time, size_t n,
+                          bool allow_date_outside_lifespan, bool raise_in_warning_zone,
+                          GeoMagResult *results);
+
+/**
+ * @brief Calculate full magnetic field results for an array of points into columns
+ *
+ * Like geomag_calculate_many, but stores each GeoMagResult field in its own
+ * array, so consumers reading one field get contiguous values.
+ * When the library is built with OpenMP the points are spread across
+ * threads. Points after the first failing one are skipped.
+ *
+ * @param geo_mag Pointer to initialized GeoMag structure
+ * @param glat Array of n geodetic latitudes in degrees
+ * @param glon Array of n geodetic longitudes in degrees
+ * @param alt Array of n altitudes in km
+ * @param time Array of n times in decimal year
+ * @param n Number of points
+ * @param allow_date_outside_lifespan Set to true to allow dates outside 5-year model span
+ * @param raise_in_warning_zone Set to true to return error codes for warning zones
+ * @param columns Output arrays, each of n elements; none may be NULL
+ * @return 0 on success, otherwise the geomag_calculate error code of the first failing point
+ */
+int geomag_calculate_many_soa(GeoMag *geo_mag, const double *glat, const double *glon,
+                              const double *alt, const double *time, size_t n,
+                              bool allow_date_outside_lifespan, bool raise_in_warning_zone,
+                              const GeoMagResultColumns *columns);
+
+/**
+ * @brief Adjust a model's Gauss coefficients to a time, for repeated use
+ *
+ * The date range is checked here once. Release the result with
+ * geomag_free_time; on error nothing is left allocated.
+ *
+ * @param geo_mag Pointer to initialized GeoMag structure
+ * @param time Time in decimal year (e.g., 2025.5 for mid-2025)
+ * @param allow_date_outside_lifespan Set to true to allow dates outside 5-year model span
+ * @param prepared Pointer to GeoMagTime structure to initialize
+ * @return 0 on success, -1 on error
+ */
+int geomag_prepare_time(const GeoMag *geo_mag, double time, bool allow_date_outside_lifespan,
+                        GeoMagTime *prepared);
+
+/**
+ * @brief Calculate magnetic field values at a prepared time
+ *
+ * Same results as geomag_calculate at prepared->time.
+ *
+ * @param geo_mag Pointer to the GeoMag structure prepared was made from
+ * @param prepared Pointer to GeoMagTime filled by geomag_prepare_time
+ * @param glat Geodetic latitude in degrees (-90 to +90, North positive)
+ * @param glon Geodetic longitude in degrees (-180 to +180, East positive)
+ * @param alt Altitude in km (-1 to 850, referenced to WGS84 ellipsoid)
+ * @param raise_in_warning_zone Set to true to return error codes for warning zones
+ * @param result Pointer to GeoMagResult structure to store results
+ * @return 0 on success, -1 on error, -2 if in blackout zone (if raise_in_warning_zone), -3 if in caution zone
+ */
+int geomag_calculate_prepared(const GeoMag *geo_mag, const GeoMagTime *prepared,
+                              double glat, double glon, double alt,
+                              bool raise_in_warning_zone, GeoMagResult *result);
+
+/**
+ * @brief Calculate magnetic field values for an array of points at a prepared time
+ *
+ * geomag_calculate_batch with every point at prepared->time.
+ *
+ * @param geo_mag Pointer to the GeoMag structure prepared was made from
+ * @param prepared Pointer to GeoMagTime filled by geomag_prepare_time
+ * @param glat Array of n geodetic latitudes in degrees
+ * @param glon Array of n geodetic longitudes in degrees
+ * @param alt Array of n altitudes in km
+ * @param n Number of points
+ * @param raise_in_warning_zone Set to true to return error codes for warning zones
+ * @param d Output array of n declinations in degrees
+ * @param i Output array of n inclinations in degrees
+ * @param x Output array of n North components in nT
+ * @param y Output array of n East components in nT
+ * @param z Output array of n Vertical components in nT
+ * @param h Output array of n horizontal intensities in nT
+ * @param f Output array of n total intensities in nT
+ * @return 0 on success, otherwise the error code of the first failing point
+ */
+int geomag_calculate_batch_prepared(const GeoMag *geo_mag, const GeoMagTime *prepared,
+                                    const double *glat, const double *glon,
+                                    const double *alt, size_t n, bool raise_in_warning_zone,
+                                    double *d, double *i, double *x, double *y, double *z,
+                                    double *h, double *f);
+
+/**
+ * @brief Free the coefficients of a prepared time
+ *
+ * Safe to call again, or after geomag_prepare_time failed.
+ *
+ * @param prepared Pointer to GeoMagTime structure to clean up
+ */
+void geomag_free_time(GeoMagTime *prepared);
+
 /**
  * @brief Calculate uncertainty estimates for a result
  *
@@ -136,6 +346,9 @@ int geomag_calculate_uncertainty(const GeoMagResult *result, GeoMagUncertainty *
 /**
  * @brief Free resources associated with a GeoMag structure
  *
+ * Safe to call again on a model that was already freed or failed to
+ * initialize.
+ *
  * @param geo_mag Pointer to GeoMag structure to clean up
  */
 void geomag_free(GeoMag *geo_mag);
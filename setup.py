@@ -2,6 +2,7 @@
 
 from setuptools import setup, Extension
 from setuptools.command.build_ext import build_ext
+import os
 import sys
 import platform
 import subprocess
@@ -28,7 +29,14 @@ class MakeExtension(build_ext):
                     path.unlink()
 
             # Run make to build the shared library
-            subprocess.check_call(["make"])
+            make_cmd = ["make"]
+            if os.environ.get("GEOMAG_OPENMP") == "1":
+                # Multi-threaded batch calculations
+                make_cmd.append("OPENMP=1")
+            if os.environ.get("GEOMAG_NATIVE") == "1":
+                # Tune for the build machine's CPU; not for distributable wheels
+                make_cmd.append("NATIVE=1")
+            subprocess.check_call(make_cmd)
         except subprocess.CalledProcessError as e:
             sys.stderr.write(f"Error building C library: {e}\n")
             sys.exit(1)
@@ -61,6 +69,26 @@ class MakeExtension(build_ext):
             return "libgeomag.so"
 
 
+def _get_ext_modules():
+    """Return the optional Cython fast path, or the placeholder extension."""
+    if os.environ.get("USE_CYTHON") == "1":
+        from Cython.Build import cythonize
+
+        # geomag.c is compiled in so the module does not depend on finding
+        # the shared library at import time
+        fast = Extension(
+            "geomag_c._geomag_fast",
+            sources=["geomag_c/_geomag_fast.pyx", "src/geomag.c"],
+            include_dirs=["include"],
+            extra_compile_args=[] if platform.system() == "Windows" else ["-std=c11"],
+            libraries=[] if platform.system() == "Windows" else ["m"],
+        )
+        return cythonize([fast])
+
+    # We don't actually build a Python extension, but we need this to trigger build_ext
+    return [Extension("geomag_c._dummy", sources=["dummy.c"])]
+
+
 # Read the README for the long description
 with open("README.md", "r", encoding="utf-8") as f:
     long_description = f.read()
@@ -104,7 +132,6 @@ setup(
         ],
     },
     include_package_data=True,
-    # We don't actually build a Python extension, but we need this to trigger build_ext
-    ext_modules=[Extension("geomag_c._dummy", sources=["dummy.c"])],
+    ext_modules=_get_ext_modules(),
     zip_safe=False,
 )
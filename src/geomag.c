@@ -6,12 +6,19 @@
  * ported from the pygeomag Python library.
  */
 
+/* posix_memalign */
+#define _POSIX_C_SOURCE 200112L
+
 #include "geomag.h"
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
 #include <math.h>
 
+#ifdef _WIN32
+#include <malloc.h>
+#endif
+
 #ifndef M_PI
 #define M_PI 3.14159265358979323846
 #endif
@@ -22,6 +29,57 @@
 /* Convert radians to degrees */
 #define RAD2DEG(rad) ((rad) * 180.0 / M_PI)
 
+/* Position of term (n, m) in the degree-packed coefficient and Legendre arrays */
+#define TERM_INDEX(n, m) ((n) * ((n) + 1) / 2 + (m))
+
+/* Number of packed terms for a model of the given size */
+#define TERM_COUNT(size) ((size_t)(size) * ((size) + 1) / 2)
+
+/* Heap arrays start on cache line boundaries, which is also the widest
+ * (AVX-512) vector load */
+#define BLOCK_ALIGNMENT 64
+#define ALIGNED_LENGTH(count) \
+    (((count) + BLOCK_ALIGNMENT / sizeof(double) - 1) & ~(BLOCK_ALIGNMENT / sizeof(double) - 1))
+
+/* Doubles in the coefficient block: g, h, dg, dh and k */
+#define BLOCK_LENGTH(size) (5 * ALIGNED_LENGTH(TERM_COUNT(size)))
+
+/**
+ * @brief Allocate count doubles aligned to BLOCK_ALIGNMENT; free with free_block
+ */
+static double *allocate_block(size_t count) {
+#ifdef _WIN32
+    return _aligned_malloc(count * sizeof(double), BLOCK_ALIGNMENT);
+#else
+    void *block = NULL;
+    if (posix_memalign(&block, BLOCK_ALIGNMENT, count * sizeof(double)) != 0) {
+        return NULL;
+    }
+    return block;
+#endif
+}
+
+static void free_block(double *block) {
+#ifdef _WIN32
+    _aligned_free(block);
+#else
+    free(block);
+#endif
+}
+
+/**
+ * @brief Point the coefficient arrays into a block of BLOCK_LENGTH(size) doubles
+ */
+static void assign_block(GeoMag *geo_mag, double *block) {
+    const size_t terms = ALIGNED_LENGTH(TERM_COUNT(geo_mag->size));
+    geo_mag->block = block;
+    geo_mag->g = block;
+    geo_mag->h = geo_mag->g + terms;
+    geo_mag->dg = geo_mag->h + terms;
+    geo_mag->dh = geo_mag->dg + terms;
+    geo_mag->k = geo_mag->dh + terms;
+}
+
 /**
  * @brief Load coefficients from a WMM coefficient file
  */
@@ -39,14 +97,6 @@ static int load_coefficients(GeoMag *geo_mag, const char *coefficients_file) {
         return -1;
     }
 
-    /* Initialize coefficient arrays */
-    memset(geo_mag->c, 0, sizeof(geo_mag->c));
-    memset(geo_mag->cd, 0, sizeof(geo_mag->cd));
-    memset(geo_mag->k, 0, sizeof(geo_mag->k));
-
-    geo_mag->c[0][0] = 0.0;
-    geo_mag->cd[0][0] = 0.0;
-
     /* Read coefficient data */
     int n, m;
     double gnm, hnm, dgnm, dhnm;
@@ -75,56 +125,42 @@ static int load_coefficients(GeoMag *geo_mag, const char *coefficients_file) {
         }
 
         /* Store coefficients */
-        if (m <= n) {
-            geo_mag->c[m][n] = gnm;
-            geo_mag->cd[m][n] = dgnm;
-            if (m != 0) {
-                geo_mag->c[n][m - 1] = hnm;
-                geo_mag->cd[n][m - 1] = dhnm;
-            }
+        geo_mag->g[TERM_INDEX(n, m)] = gnm;
+        geo_mag->dg[TERM_INDEX(n, m)] = dgnm;
+        if (m != 0) {
+            geo_mag->h[TERM_INDEX(n, m)] = hnm;
+            geo_mag->dh[TERM_INDEX(n, m)] = dhnm;
         }
     }
 
     fclose(fp);
 
     /* Convert Schmidt normalized Gauss coefficients to unnormalized */
-    double snorm[WMM_MAX_SIZE * WMM_MAX_SIZE];
+    double snorm[WMM_MAX_TERMS];
     snorm[0] = 1.0;
-    geo_mag->fm[0] = 0.0;
 
     for (n = 1; n <= geo_mag->maxord; n++) {
-        snorm[n] = snorm[n - 1] * (double)(2 * n - 1) / (double)n;
+        const int row = TERM_INDEX(n, 0);
+        snorm[row] = snorm[TERM_INDEX(n - 1, 0)] * (double)(2 * n - 1) / (double)n;
         int j = 2;
-        m = 0;
-        int D1 = 1;
-        int D2 = (n - m + D1) / D1;
 
-        while (D2 > 0) {
-            double flnmj;
-            geo_mag->k[m][n] = (double)((n - 1) * (n - 1) - m * m) / (double)((2 * n - 1) * (2 * n - 3));
+        for (m = 0; m <= n; m++) {
+            geo_mag->k[row + m] = (double)((n - 1) * (n - 1) - m * m) / (double)((2 * n - 1) * (2 * n - 3));
 
             if (m > 0) {
-                flnmj = (double)((n - m + 1) * j) / (double)(n + m);
-                snorm[n + m * geo_mag->size] = snorm[n + (m - 1) * geo_mag->size] * sqrt(flnmj);
+                double flnmj = (double)((n - m + 1) * j) / (double)(n + m);
+                snorm[row + m] = snorm[row + m - 1] * sqrt(flnmj);
                 j = 1;
-                geo_mag->c[n][m - 1] = snorm[n + m * geo_mag->size] * geo_mag->c[n][m - 1];
-                geo_mag->cd[n][m - 1] = snorm[n + m * geo_mag->size] * geo_mag->cd[n][m - 1];
+                geo_mag->h[row + m] = snorm[row + m] * geo_mag->h[row + m];
+                geo_mag->dh[row + m] = snorm[row + m] * geo_mag->dh[row + m];
             }
 
-            geo_mag->c[m][n] = snorm[n + m * geo_mag->size] * geo_mag->c[m][n];
-            geo_mag->cd[m][n] = snorm[n + m * geo_mag->size] * geo_mag->cd[m][n];
-            D2 -= 1;
-            m += D1;
+            geo_mag->g[row + m] = snorm[row + m] * geo_mag->g[row + m];
+            geo_mag->dg[row + m] = snorm[row + m] * geo_mag->dg[row + m];
         }
-
-        geo_mag->fn[n] = (double)(n + 1);
-        geo_mag->fm[n] = (double)n;
     }
 
-    geo_mag->k[1][1] = 0.0;
-
-    /* Store p (snorm) values */
-    memcpy(geo_mag->p, snorm, sizeof(snorm));
+    geo_mag->k[TERM_INDEX(1, 1)] = 0.0;
 
     return 0;
 }
@@ -142,43 +178,81 @@ int geomag_init(GeoMag *geo_mag, const char *coefficients_file, bool high_resolu
     }
     geo_mag->size = geo_mag->maxord + 1;
 
+    /* Coefficient arrays sized for this model, zeroed so terms missing from
+     * the file read as 0 */
+    double *block = allocate_block(BLOCK_LENGTH(geo_mag->size));
+    if (!block) {
+        fprintf(stderr, "Error: Cannot allocate coefficient arrays\n");
+        geo_mag->block = NULL;
+        geomag_free(geo_mag);
+        return -1;
+    }
+    memset(block, 0, BLOCK_LENGTH(geo_mag->size) * sizeof(double));
+    assign_block(geo_mag, block);
+
     /* Load coefficients from file */
-    return load_coefficients(geo_mag, coefficients_file);
+    if (load_coefficients(geo_mag, coefficients_file) != 0) {
+        geomag_free(geo_mag);
+        return -1;
+    }
+
+    return 0;
 }
 
-int geomag_calculate(GeoMag *geo_mag, double glat, double glon, double alt, double time,
-                     bool allow_date_outside_lifespan, bool raise_in_warning_zone,
-                     GeoMagResult *result) {
-    if (!geo_mag || !result) {
+int geomag_copy(GeoMag *dst, const GeoMag *src) {
+    if (!dst || !src || !src->block) {
         return -1;
     }
 
-    /* Initialize result structure */
-    result->time = time;
-    result->alt = alt;
-    result->glat = glat;
-    result->glon = glon;
-    result->in_blackout_zone = false;
-    result->in_caution_zone = false;
-    result->is_high_resolution = (geo_mag->maxord == WMM_SIZE_HIGH_RESOLUTION);
+    double *block = allocate_block(BLOCK_LENGTH(src->size));
+    if (!block) {
+        fprintf(stderr, "Error: Cannot allocate coefficient arrays\n");
+        return -1;
+    }
+    memcpy(block, src->block, BLOCK_LENGTH(src->size) * sizeof(double));
 
-    /* Working arrays */
-    double tc[WMM_MAX_SIZE][WMM_MAX_SIZE];
-    double dp[WMM_MAX_SIZE][WMM_MAX_SIZE];
-    double sp[WMM_MAX_SIZE];
-    double cp[WMM_MAX_SIZE];
-    double pp[WMM_MAX_SIZE];
+    *dst = *src;
+    assign_block(dst, block);
+    return 0;
+}
 
-    /* Initialize constants */
-    sp[0] = 0.0;
-    cp[0] = 1.0;
-    pp[0] = 1.0;
-    dp[0][0] = 0.0;
+/**
+ * @brief Latitude and altitude dependent part of a calculation
+ *
+ * The geocentric position and the associated Legendre functions depend only
+ * on geodetic latitude and altitude, not on longitude or time. They are kept
+ * together so that consecutive points sharing both (grid rows, time series at
+ * a fixed location) reuse them instead of redoing the recursion.
+ */
+typedef struct {
+    bool valid;      /* Tables hold data for (glat, alt) */
+    double glat;
+    double alt;
+
+    double ct;       /* Cosine of geocentric colatitude */
+    double st;       /* Sine of geocentric colatitude */
+    double r;        /* Geocentric radius in km */
+    double ca;       /* Rotation from spherical to geodetic components */
+    double sa;
+
+    /* Packed by degree like the coefficients (see TERM_INDEX) */
+    double p[WMM_MAX_TERMS];   /* Unnormalized associated Legendre functions */
+    double dp[WMM_MAX_TERMS];  /* Their derivatives */
+    double pp[WMM_MAX_SIZE];   /* Legendre functions at the poles (st == 0) */
+} LegendreTables;
+
+/**
+ * @brief Fill the latitude/altitude dependent tables, unless already current
+ */
+static void update_legendre_tables(const GeoMag *geo_mag, double glat, double alt,
+                                   LegendreTables *tables) {
+    if (tables->valid && tables->glat == glat && tables->alt == alt) {
+        return;
+    }
 
     /* WGS84 ellipsoid parameters */
     const double a = WGS84_A;
     const double b = WGS84_B;
-    const double re = WGS84_RE;
     const double a2 = a * a;
     const double b2 = b * b;
     const double c2 = a2 - b2;
@@ -186,26 +260,12 @@ int geomag_calculate(GeoMag *geo_mag, double glat, double glon, double alt, doub
     const double b4 = b2 * b2;
     const double c4 = a4 - b4;
 
-    /* Check date range */
-    double dt = time - geo_mag->epoch;
-    if (!allow_date_outside_lifespan && (dt < 0.0 || dt > 5.0)) {
-        fprintf(stderr, "Error: Time extends beyond model 5-year life span\n");
-        return -1;
-    }
-
-    /* Convert to radians */
-    double rlon = DEG2RAD(glon);
     double rlat = DEG2RAD(glat);
-    double srlon = sin(rlon);
     double srlat = sin(rlat);
-    double crlon = cos(rlon);
     double crlat = cos(rlat);
     double srlat2 = srlat * srlat;
     double crlat2 = crlat * crlat;
 
-    sp[1] = srlon;
-    cp[1] = crlon;
-
     /* Convert from geodetic to spherical coordinates */
     double q = sqrt(a2 - c2 * srlat2);
     double q1 = alt * q;
@@ -215,82 +275,127 @@ int geomag_calculate(GeoMag *geo_mag, double glat, double glon, double alt, doub
     double r2 = (alt * alt) + 2.0 * q1 + (a4 - c4 * srlat2) / (q * q);
     double r = sqrt(r2);
     double d = sqrt(a2 * crlat2 + b2 * srlat2);
-    double ca = (alt + d) / r;
-    double sa = c2 * crlat * srlat / (r * d);
+
+    tables->ct = ct;
+    tables->st = st;
+    tables->r = r;
+    tables->ca = (alt + d) / r;
+    tables->sa = c2 * crlat * srlat / (r * d);
+
+    /* Compute unnormalized associated Legendre polynomials and derivatives */
+    double *p = tables->p;
+    double *dp = tables->dp;
+    const double *k = geo_mag->k;
+
+    p[0] = 1.0;
+    dp[0] = 0.0;
+
+    for (int n = 1; n <= geo_mag->maxord; n++) {
+        const int row = TERM_INDEX(n, 0);
+        const int row1 = TERM_INDEX(n - 1, 0);
+        const int row2 = (n > 1) ? TERM_INDEX(n - 2, 0) : 0;
+
+        for (int m = 0; m <= n; m++) {
+            if (n == m) {
+                p[row + m] = st * p[row1 + m - 1];
+                dp[row + m] = st * dp[row1 + m - 1] + ct * p[row1 + m - 1];
+            } else if (n == 1 && m == 0) {
+                p[row] = ct * p[row1];
+                dp[row] = ct * dp[row1] - st * p[row1];
+            } else {
+                /* Degree n - 2 has no order n - 1 term; it contributes zero */
+                double p2 = (m <= n - 2) ? p[row2 + m] : 0.0;
+                double dp2 = (m <= n - 2) ? dp[row2 + m] : 0.0;
+                p[row + m] = ct * p[row1 + m] - k[row + m] * p2;
+                dp[row + m] = ct * dp[row1 + m] - st * p[row1 + m] - k[row + m] * dp2;
+            }
+        }
+    }
+
+    /* Special case: North/South geographic poles */
+    if (st == 0.0) {
+        double *pp = tables->pp;
+        pp[0] = 1.0;
+        for (int n = 1; n <= geo_mag->maxord; n++) {
+            if (n == 1) {
+                pp[n] = pp[n - 1];
+            } else {
+                pp[n] = ct * pp[n - 1] - k[TERM_INDEX(n, 1)] * pp[n - 2];
+            }
+        }
+    }
+
+    tables->glat = glat;
+    tables->alt = alt;
+    tables->valid = true;
+}
+
+/**
+ * @brief Sum the spherical harmonic expansion into geodetic X, Y, Z components
+ *
+ * With time_adjust the Gauss coefficients g and h are moved to epoch + dt
+ * using the model's secular variation; without it they are used as given
+ * (already adjusted by geomag_prepare_time). Both call sites pass a constant,
+ * so each gets a specialized copy of the loop.
+ */
+static inline void field_from_tables(const GeoMag *geo_mag, const double *g, const double *h,
+                                     bool time_adjust, double dt,
+                                     const LegendreTables *tables, double glon,
+                                     double *bx, double *by, double *bz) {
+    double sp[WMM_MAX_SIZE];
+    double cp[WMM_MAX_SIZE];
+
+    const double *p = tables->p;
+    const double *dp = tables->dp;
+    const double st = tables->st;
 
     /* Compute sine and cosine of longitude multiples */
+    double rlon = DEG2RAD(glon);
+    sp[0] = 0.0;
+    cp[0] = 1.0;
+    sp[1] = sin(rlon);
+    cp[1] = cos(rlon);
+
     for (int m = 2; m <= geo_mag->maxord; m++) {
         sp[m] = sp[1] * cp[m - 1] + cp[1] * sp[m - 1];
         cp[m] = cp[1] * cp[m - 1] - sp[1] * sp[m - 1];
     }
 
-    double aor = re / r;
+    double aor = WGS84_RE / tables->r;
     double ar = aor * aor;
     double br = 0.0, bt = 0.0, bp = 0.0, bpp = 0.0;
 
-    /* Main computation loop */
     for (int n = 1; n <= geo_mag->maxord; n++) {
+        const int row = TERM_INDEX(n, 0);
+        const double fn = (double)(n + 1);
         ar = ar * aor;
-        int m = 0;
-        int D3 = 1;
-        int D4 = (n + m + D3) / D3;
 
-        while (D4 > 0) {
-            /* Compute unnormalized associated Legendre polynomials and derivatives */
-            if (n == m) {
-                geo_mag->p[n + m * geo_mag->size] = st * geo_mag->p[n - 1 + (m - 1) * geo_mag->size];
-                dp[m][n] = st * dp[m - 1][n - 1] + ct * geo_mag->p[n - 1 + (m - 1) * geo_mag->size];
-            } else if (n == 1 && m == 0) {
-                geo_mag->p[n + m * geo_mag->size] = ct * geo_mag->p[n - 1 + m * geo_mag->size];
-                dp[m][n] = ct * dp[m][n - 1] - st * geo_mag->p[n - 1 + m * geo_mag->size];
-            } else if (n > 1 && n != m) {
-                if (m > n - 2) {
-                    geo_mag->p[n - 2 + m * geo_mag->size] = 0.0;
-                }
-                if (m > n - 2) {
-                    dp[m][n - 2] = 0.0;
-                }
-                geo_mag->p[n + m * geo_mag->size] = ct * geo_mag->p[n - 1 + m * geo_mag->size] -
-                                                      geo_mag->k[m][n] * geo_mag->p[n - 2 + m * geo_mag->size];
-                dp[m][n] = ct * dp[m][n - 1] - st * geo_mag->p[n - 1 + m * geo_mag->size] -
-                           geo_mag->k[m][n] * dp[m][n - 2];
-            }
-
-            /* Time adjust the Gauss coefficients */
-            tc[m][n] = geo_mag->c[m][n] + dt * geo_mag->cd[m][n];
-            if (m != 0) {
-                tc[n][m - 1] = geo_mag->c[n][m - 1] + dt * geo_mag->cd[n][m - 1];
-            }
+        for (int m = 0; m <= n; m++) {
+            /* Time adjust the Gauss coefficients (only needed for this term) */
+            double gnm = time_adjust ? g[row + m] + dt * geo_mag->dg[row + m] : g[row + m];
 
             /* Accumulate terms of the spherical harmonic expansions */
-            double par = ar * geo_mag->p[n + m * geo_mag->size];
+            double par = ar * p[row + m];
             double temp1, temp2;
 
             if (m == 0) {
-                temp1 = tc[m][n] * cp[m];
-                temp2 = tc[m][n] * sp[m];
+                temp1 = gnm * cp[m];
+                temp2 = gnm * sp[m];
             } else {
-                temp1 = tc[m][n] * cp[m] + tc[n][m - 1] * sp[m];
-                temp2 = tc[m][n] * sp[m] - tc[n][m - 1] * cp[m];
+                double hnm = time_adjust ? h[row + m] + dt * geo_mag->dh[row + m] : h[row + m];
+                temp1 = gnm * cp[m] + hnm * sp[m];
+                temp2 = gnm * sp[m] - hnm * cp[m];
             }
 
-            bt = bt - ar * temp1 * dp[m][n];
-            bp += geo_mag->fm[m] * temp2 * par;
-            br += geo_mag->fn[n] * temp1 * par;
+            bt = bt - ar * temp1 * dp[row + m];
+            bp += (double)m * temp2 * par;
+            br += fn * temp1 * par;
 
             /* Special case: North/South geographic poles */
             if (st == 0.0 && m == 1) {
-                if (n == 1) {
-                    pp[n] = pp[n - 1];
-                } else {
-                    pp[n] = ct * pp[n - 1] - geo_mag->k[m][n] * pp[n - 2];
-                }
-                double parp = ar * pp[n];
-                bpp += geo_mag->fm[m] * temp2 * parp;
+                double parp = ar * tables->pp[n];
+                bpp += temp2 * parp;
             }
-
-            D4 -= 1;
-            m += D3;
         }
     }
 
@@ -301,9 +406,58 @@ int geomag_calculate(GeoMag *geo_mag, double glat, double glon, double alt, doub
     }
 
     /* Rotate magnetic vector components from spherical to geodetic coordinates */
-    double bx = -bt * ca - br * sa;
-    double by = bp;
-    double bz = bt * sa - br * ca;
+    *bx = -bt * tables->ca - br * tables->sa;
+    *by = bp;
+    *bz = bt * tables->sa - br * tables->ca;
+}
+
+/**
+ * @brief Check time against the model's 5-year life span, unless allowed
+ */
+static int check_lifespan(const GeoMag *geo_mag, double time, bool allow_date_outside_lifespan) {
+    double dt = time - geo_mag->epoch;
+    if (!allow_date_outside_lifespan && (dt < 0.0 || dt > 5.0)) {
+        fprintf(stderr, "Error: Time extends beyond model 5-year life span\n");
+        return -1;
+    }
+    return 0;
+}
+
+/**
+ * @brief geomag_calculate, reusing tables when they match the point
+ *
+ * With prepared, its time-adjusted coefficients are used and time must be
+ * prepared->time (its date range was checked when it was prepared).
+ */
+static int calculate_point(const GeoMag *geo_mag, const GeoMagTime *prepared,
+                           LegendreTables *tables,
+                           double glat, double glon, double alt, double time,
+                           bool allow_date_outside_lifespan, bool raise_in_warning_zone,
+                           GeoMagResult *result) {
+    /* Initialize result structure */
+    result->time = time;
+    result->alt = alt;
+    result->glat = glat;
+    result->glon = glon;
+    result->in_blackout_zone = false;
+    result->in_caution_zone = false;
+    result->is_high_resolution = (geo_mag->maxord == WMM_SIZE_HIGH_RESOLUTION);
+
+    /* Check date range */
+    if (!prepared && check_lifespan(geo_mag, time, allow_date_outside_lifespan) != 0) {
+        return -1;
+    }
+
+    double bx, by, bz;
+    update_legendre_tables(geo_mag, glat, alt, tables);
+
+    if (prepared) {
+        field_from_tables(geo_mag, prepared->g, prepared->h, false, 0.0,
+                          tables, glon, &bx, &by, &bz);
+    } else {
+        field_from_tables(geo_mag, geo_mag->g, geo_mag->h, true, time - geo_mag->epoch,
+                          tables, glon, &bx, &by, &bz);
+    }
 
     /* Compute declination (D), inclination (I), and total intensity (F) */
     double bh = sqrt(bx * bx + by * by);
@@ -331,11 +485,12 @@ int geomag_calculate(GeoMag *geo_mag, double glat, double glon, double alt, doub
         }
     }
 
-    /* Compute X, Y, Z, and H components */
-    result->x = result->f * cos(DEG2RAD(result->d)) * cos(DEG2RAD(result->i));
-    result->y = result->f * cos(DEG2RAD(result->i)) * sin(DEG2RAD(result->d));
-    result->z = result->f * sin(DEG2RAD(result->i));
-    result->h = result->f * cos(DEG2RAD(result->i));
+    /* X, Y, Z, and H are the geodetic components themselves; recovering them
+     * from D and I (f * cos(d) * cos(i), ...) only adds trig and rounding */
+    result->x = bx;
+    result->y = by;
+    result->z = bz;
+    result->h = bh;
 
     /* Check for blackout and caution zones */
     if (result->h < BLACKOUT_ZONE) {
@@ -355,6 +510,263 @@ int geomag_calculate(GeoMag *geo_mag, double glat, double glon, double alt, doub
     return 0;
 }
 
+int geomag_calculate(GeoMag *geo_mag, double glat, double glon, double alt, double time,
+                     bool allow_date_outside_lifespan, bool raise_in_warning_zone,
+                     GeoMagResult *result) {
+    if (!geo_mag || !geo_mag->block || !result) {
+        return -1;
+    }
+
+    /* Working tables are kept local so the model is never written to and can
+     * be shared by concurrent calls */
+    LegendreTables tables;
+    tables.valid = false;
+
+    return calculate_point(geo_mag, NULL, &tables, glat, glon, alt, time,
+                           allow_date_outside_lifespan, raise_in_warning_zone, result);
+}
+
+/* Stores the result of point j into a batch's output buffers */
+typedef void (*StorePointFn)(void *out, size_t j, const GeoMagResult *result);
+
+/* Evaluates n points, handing each successful result to store. With prepared,
+ * time is unused and every point is at prepared->time. */
+static int calculate_points(const GeoMag *geo_mag, const GeoMagTime *prepared,
+                            const double *glat, const double *glon,
+                            const double *alt, const double *time, size_t n,
+                            bool allow_date_outside_lifespan, bool raise_in_warning_zone,
+                            StorePointFn store, void *out) {
+    /* Points are independent, so the loop is split across threads when built
+     * with OpenMP. Once a point fails, later points are skipped; earlier ones
+     * still run so the reported error is always that of the lowest index. */
+    size_t first_error = n;
+    int status = 0;
+
+#ifdef _OPENMP
+#pragma omp parallel
+#endif
+    {
+        /* One set of tables per thread, reused while consecutive points share
+         * latitude and altitude */
+        LegendreTables tables;
+        tables.valid = false;
+
+#ifdef _OPENMP
+#pragma omp for schedule(static)
+#endif
+        for (size_t j = 0; j < n; j++) {
+            size_t stop;
+#ifdef _OPENMP
+#pragma omp atomic read
+#endif
+            stop = first_error;
+            if (j > stop) {
+                continue;
+            }
+
+            GeoMagResult result;
+            int ret = calculate_point(geo_mag, prepared, &tables, glat[j], glon[j], alt[j],
+                                      prepared ? prepared->time : time[j],
+                                      allow_date_outside_lifespan, raise_in_warning_zone,
+                                      &result);
+            if (ret != 0) {
+#ifdef _OPENMP
+#pragma omp critical(geomag_batch_error)
+#endif
+                {
+                    if (j < first_error) {
+                        /* Atomic so it does not race with the unlocked read above */
+#ifdef _OPENMP
+#pragma omp atomic write
+#endif
+                        first_error = j;
+                        status = ret;
+                    }
+                }
+                continue;
+            }
+
+            store(out, j, &result);
+        }
+    }
+
+    return status;
+}
+
+typedef struct {
+    double *d, *i, *x, *y, *z, *h, *f;
+} BatchColumns;
+
+static void store_columns(void *out, size_t j, const GeoMagResult *result) {
+    BatchColumns *columns = out;
+    columns->d[j] = result->d;
+    columns->i[j] = result->i;
+    columns->x[j] = result->x;
+    columns->y[j] = result->y;
+    columns->z[j] = result->z;
+    columns->h[j] = result->h;
+    columns->f[j] = result->f;
+}
+
+static void store_result(void *out, size_t j, const GeoMagResult *result) {
+    ((GeoMagResult *)out)[j] = *result;
+}
+
+static void store_result_columns(void *out, size_t j, const GeoMagResult *result) {
+    const GeoMagResultColumns *columns = out;
+    columns->time[j] = result->time;
+    columns->alt[j] = result->alt;
+    columns->glat[j] = result->glat;
+    columns->glon[j] = result->glon;
+    columns->x[j] = result->x;
+    columns->y[j] = result->y;
+    columns->z[j] = result->z;
+    columns->h[j] = result->h;
+    columns->f[j] = result->f;
+    columns->i[j] = result->i;
+    columns->d[j] = result->d;
+    columns->gv[j] = result->gv;
+    columns->in_blackout_zone[j] = result->in_blackout_zone;
+    columns->in_caution_zone[j] = result->in_caution_zone;
+    columns->is_high_resolution[j] = result->is_high_resolution;
+}
+
+int geomag_calculate_batch(GeoMag *geo_mag, const double *glat, const double *glon,
+                           const double *alt, const double *time, size_t n,
+                           bool allow_date_outside_lifespan, bool raise_in_warning_zone,
+                           double *d, double *i, double *x, double *y, double *z,
+                           double *h, double *f) {
+    if (!geo_mag || !geo_mag->block || !glat || !glon || !alt || !time ||
+        !d || !i || !x || !y || !z || !h || !f) {
+        return -1;
+    }
+
+    BatchColumns columns = {d, i, x, y, z, h, f};
+    return calculate_points(geo_mag, NULL, glat, glon, alt, time, n,
+                            allow_date_outside_lifespan, raise_in_warning_zone,
+                            store_columns, &columns);
+}
+
+int geomag_calculate_many(GeoMag *geo_mag, const double *glat, const double *glon,
+                          const double *alt, const double *time, size_t n,
+                          bool allow_date_outside_lifespan, bool raise_in_warning_zone,
+                          GeoMagResult *results) {
+    if (!geo_mag || !geo_mag->block || !glat || !glon || !alt || !time || !results) {
+        return -1;
+    }
+
+    return calculate_points(geo_mag, NULL, glat, glon, alt, time, n,
+                            allow_date_outside_lifespan, raise_in_warning_zone,
+                            store_result, results);
+}
+
+int geomag_calculate_many_soa(GeoMag *geo_mag, const double *glat, const double *glon,
+                              const double *alt, const double *time, size_t n,
+                              bool allow_date_outside_lifespan, bool raise_in_warning_zone,
+                              const GeoMagResultColumns *columns) {
+    if (!geo_mag || !geo_mag->block || !glat || !glon || !alt || !time || !columns ||
+        !columns->time || !columns->alt || !columns->glat || !columns->glon ||
+        !columns->x || !columns->y || !columns->z || !columns->h || !columns->f ||
+        !columns->i || !columns->d || !columns->gv || !columns->in_blackout_zone ||
+        !columns->in_caution_zone || !columns->is_high_resolution) {
+        return -1;
+    }
+
+    /* The store callback only reads the column pointers */
+    return calculate_points(geo_mag, NULL, glat, glon, alt, time, n,
+                            allow_date_outside_lifespan, raise_in_warning_zone,
+                            store_result_columns, (void *)columns);
+}
+
+int geomag_prepare_time(const GeoMag *geo_mag, double time, bool allow_date_outside_lifespan,
+                        GeoMagTime *prepared) {
+    if (!prepared) {
+        return -1;
+    }
+    prepared->block = NULL;
+    prepared->g = NULL;
+    prepared->h = NULL;
+
+    if (!geo_mag || !geo_mag->block) {
+        return -1;
+    }
+
+    if (check_lifespan(geo_mag, time, allow_date_outside_lifespan) != 0) {
+        return -1;
+    }
+
+    const size_t terms = TERM_COUNT(geo_mag->size);
+    double *block = allocate_block(2 * ALIGNED_LENGTH(terms));
+    if (!block) {
+        fprintf(stderr, "Error: Cannot allocate prepared coefficients\n");
+        return -1;
+    }
+
+    /* Same expression as the per-term adjustment in field_from_tables, so
+     * prepared results are identical to unprepared ones */
+    const double dt = time - geo_mag->epoch;
+    double *g = block;
+    double *h = block + ALIGNED_LENGTH(terms);
+    for (size_t t = 0; t < terms; t++) {
+        g[t] = geo_mag->g[t] + dt * geo_mag->dg[t];
+        h[t] = geo_mag->h[t] + dt * geo_mag->dh[t];
+    }
+
+    prepared->time = time;
+    prepared->size = geo_mag->size;
+    prepared->block = block;
+    prepared->g = g;
+    prepared->h = h;
+    return 0;
+}
+
+/* A prepared time can only be used with a model of the size it came from */
+static bool prepared_matches(const GeoMag *geo_mag, const GeoMagTime *prepared) {
+    return geo_mag && geo_mag->block && prepared && prepared->block &&
+           prepared->size == geo_mag->size;
+}
+
+int geomag_calculate_prepared(const GeoMag *geo_mag, const GeoMagTime *prepared,
+                              double glat, double glon, double alt,
+                              bool raise_in_warning_zone, GeoMagResult *result) {
+    if (!prepared_matches(geo_mag, prepared) || !result) {
+        return -1;
+    }
+
+    LegendreTables tables;
+    tables.valid = false;
+
+    return calculate_point(geo_mag, prepared, &tables, glat, glon, alt, prepared->time,
+                           true, raise_in_warning_zone, result);
+}
+
+int geomag_calculate_batch_prepared(const GeoMag *geo_mag, const GeoMagTime *prepared,
+                                    const double *glat, const double *glon,
+                                    const double *alt, size_t n, bool raise_in_warning_zone,
+                                    double *d, double *i, double *x, double *y, double *z,
+                                    double *h, double *f) {
+    if (!prepared_matches(geo_mag, prepared) || !glat || !glon || !alt ||
+        !d || !i || !x || !y || !z || !h || !f) {
+        return -1;
+    }
+
+    BatchColumns columns = {d, i, x, y, z, h, f};
+    return calculate_points(geo_mag, prepared, glat, glon, alt, NULL, n,
+                            true, raise_in_warning_zone,
+                            store_columns, &columns);
+}
+
+void geomag_free_time(GeoMagTime *prepared) {
+    if (!prepared) {
+        return;
+    }
+
+    free_block(prepared->block);
+    prepared->block = NULL;
+    prepared->g = NULL;
+    prepared->h = NULL;
+}
+
 int geomag_calculate_uncertainty(const GeoMagResult *result, GeoMagUncertainty *uncertainty) {
     if (!result || !uncertainty) {
         return -1;
@@ -408,7 +820,15 @@ int geomag_calculate_uncertainty(const GeoMagResult *result, GeoMagUncertainty *
 }
 
 void geomag_free(GeoMag *geo_mag) {
-    /* Currently no dynamic allocation, so nothing to free */
-    /* This function is provided for API completeness and future extensibility */
-    (void)geo_mag;
+    if (!geo_mag) {
+        return;
+    }
+
+    free_block(geo_mag->block);
+    geo_mag->block = NULL;
+    geo_mag->g = NULL;
+    geo_mag->h = NULL;
+    geo_mag->dg = NULL;
+    geo_mag->dh = NULL;
+    geo_mag->k = NULL;
 }
\ No newline at end of file
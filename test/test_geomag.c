@@ -301,6 +301,210 @@ void test_performance() {
     geomag_free(&geo_mag);
 }
 
+/* Test 9: Batch calculation */
+void test_batch() {
+    printf("\nTest 9: Batch calculation (WMM-2025)\n");
+
+    GeoMag geo_mag;
+    GeoMagResult result;
+
+    if (geomag_init(&geo_mag, "data/WMM.COF", false) != 0) {
+        printf("  ✗ Failed to initialize GeoMag\n");
+        test_failed++;
+        return;
+    }
+
+    /* Consecutive points sharing latitude and altitude reuse Legendre tables */
+    double lat[] = {47.6205, 47.6205, -33.8688, 90.0, 90.0, 0.0};
+    double lon[] = {-122.3493, 10.0, 151.2093, 0.0, 45.0, 0.0};
+    double alt[] = {0.0, 0.0, 0.0, 10.0, 10.0, 0.0};
+    double time[] = {2025.25, 2027.0, 2025.8, 2026.5, 2026.5, 2025.0};
+    double d[6], i[6], x[6], y[6], z[6], h[6], f[6];
+
+    if (geomag_calculate_batch(&geo_mag, lat, lon, alt, time, 6, false, false,
+                               d, i, x, y, z, h, f) != 0) {
+        printf("  ✗ Failed to calculate batch\n");
+        test_failed++;
+        geomag_free(&geo_mag);
+        return;
+    }
+
+    /* Every batch entry must match the single-point calculation */
+    for (int j = 0; j < 6; j++) {
+        geomag_calculate(&geo_mag, lat[j], lon[j], alt[j], time[j], false, false, &result);
+        assert_near("Batch Declination", result.d, d[j], 1e-9);
+        assert_near("Batch Total Intensity", result.f, f[j], 1e-9);
+    }
+
+    /* A point outside the model lifespan fails the whole batch */
+    time[2] = 2031.0;
+    if (geomag_calculate_batch(&geo_mag, lat, lon, alt, time, 6, false, false,
+                               d, i, x, y, z, h, f) != 0) {
+        printf("  ✓ Correctly rejected batch with date outside lifespan\n");
+        test_passed++;
+    } else {
+        printf("  ✗ Should have rejected batch with date outside lifespan\n");
+        test_failed++;
+    }
+    test_count++;
+
+    geomag_free(&geo_mag);
+}
+
+void test_many() {
+    printf("\nTest 10: Full-result array calculation (WMM-2025)\n");
+
+    GeoMag geo_mag;
+    GeoMagResult result;
+
+    if (geomag_init(&geo_mag, "data/WMM.COF", false) != 0) {
+        printf("  ✗ Failed to initialize GeoMag\n");
+        test_failed++;
+        return;
+    }
+
+    double lat[] = {47.6205, 80.0, -80.0, 0.0};
+    double lon[] = {-122.3493, 100.0, -45.0, 0.0};
+    double alt[] = {0.0, 0.0, 0.0, 0.0};
+    double time[] = {2025.25, 2026.0, 2026.0, 2025.0};
+    GeoMagResult results[4];
+
+    if (geomag_calculate_many(&geo_mag, lat, lon, alt, time, 4, false, false, results) != 0) {
+        printf("  ✗ Failed to calculate points\n");
+        test_failed++;
+        geomag_free(&geo_mag);
+        return;
+    }
+
+    /* Every entry, grid variation included, must match the single-point calculation */
+    for (int j = 0; j < 4; j++) {
+        geomag_calculate(&geo_mag, lat[j], lon[j], alt[j], time[j], false, false, &result);
+        assert_near("Many Declination", result.d, results[j].d, 1e-9);
+        assert_near("Many Grid Variation", result.gv, results[j].gv, 1e-9);
+    }
+
+    /* The column layout must hold the same values as the array of results */
+    double c_time[4], c_alt[4], c_glat[4], c_glon[4], c_x[4], c_y[4], c_z[4], c_h[4];
+    double c_f[4], c_i[4], c_d[4], c_gv[4];
+    bool c_blackout[4], c_caution[4], c_high_res[4];
+    GeoMagResultColumns columns = {c_time, c_alt, c_glat, c_glon, c_x, c_y, c_z, c_h,
+                                   c_f, c_i, c_d, c_gv, c_blackout, c_caution, c_high_res};
+
+    if (geomag_calculate_many_soa(&geo_mag, lat, lon, alt, time, 4, false, false,
+                                  &columns) != 0) {
+        printf("  ✗ Failed to calculate points into columns\n");
+        test_failed++;
+        geomag_free(&geo_mag);
+        return;
+    }
+
+    for (int j = 0; j < 4; j++) {
+        assert_near("Column Declination", results[j].d, c_d[j], 1e-9);
+        assert_near("Column Grid Variation", results[j].gv, c_gv[j], 1e-9);
+    }
+
+    geomag_free(&geo_mag);
+}
+
+void test_copy() {
+    printf("\nTest 11: Model copy (WMM-2025)\n");
+
+    GeoMag geo_mag, copy;
+    GeoMagResult expected, result;
+
+    if (geomag_init(&geo_mag, "data/WMM.COF", false) != 0) {
+        printf("  ✗ Failed to initialize GeoMag\n");
+        test_failed++;
+        return;
+    }
+
+    geomag_calculate(&geo_mag, 47.6205, -122.3493, 0.0, 2025.25, false, false, &expected);
+
+    if (geomag_copy(&copy, &geo_mag) != 0) {
+        printf("  ✗ Failed to copy GeoMag\n");
+        test_failed++;
+        geomag_free(&geo_mag);
+        return;
+    }
+
+    /* The copy owns its own coefficients, so it outlives the original */
+    geomag_free(&geo_mag);
+    geomag_calculate(&copy, 47.6205, -122.3493, 0.0, 2025.25, false, false, &result);
+    assert_near("Copy Declination", expected.d, result.d, 1e-12);
+    assert_near("Copy Total Intensity", expected.f, result.f, 1e-12);
+
+    /* A freed model is rejected instead of read */
+    if (geomag_calculate(&geo_mag, 47.6205, -122.3493, 0.0, 2025.25, false, false,
+                         &result) != 0) {
+        printf("  ✓ Correctly rejected freed model\n");
+        test_passed++;
+    } else {
+        printf("  ✗ Should have rejected freed model\n");
+        test_failed++;
+    }
+    test_count++;
+
+    geomag_free(&copy);
+}
+
+void test_prepared_time() {
+    printf("\nTest 12: Prepared time (WMM-2025)\n");
+
+    GeoMag geo_mag;
+    GeoMagTime prepared;
+    GeoMagResult expected, result;
+
+    if (geomag_init(&geo_mag, "data/WMM.COF", false) != 0) {
+        printf("  ✗ Failed to initialize GeoMag\n");
+        test_failed++;
+        return;
+    }
+
+    if (geomag_prepare_time(&geo_mag, 2026.5, false, &prepared) != 0) {
+        printf("  ✗ Failed to prepare time\n");
+        test_failed++;
+        geomag_free(&geo_mag);
+        return;
+    }
+
+    double lat[] = {47.6205, 47.6205, 90.0, -33.8688};
+    double lon[] = {-122.3493, 10.0, 0.0, 151.2093};
+    double alt[] = {0.0, 0.0, 10.0, 0.0};
+    double d[4], i[4], x[4], y[4], z[4], h[4], f[4];
+
+    /* Prepared calculations must match calculating at the same time directly */
+    geomag_calculate(&geo_mag, lat[0], lon[0], alt[0], 2026.5, false, false, &expected);
+    geomag_calculate_prepared(&geo_mag, &prepared, lat[0], lon[0], alt[0], false, &result);
+    assert_near("Prepared Declination", expected.d, result.d, 1e-12);
+    assert_near("Prepared Total Intensity", expected.f, result.f, 1e-12);
+
+    if (geomag_calculate_batch_prepared(&geo_mag, &prepared, lat, lon, alt, 4, false,
+                                        d, i, x, y, z, h, f) != 0) {
+        printf("  ✗ Failed to calculate prepared batch\n");
+        test_failed++;
+    } else {
+        for (int j = 0; j < 4; j++) {
+            geomag_calculate(&geo_mag, lat[j], lon[j], alt[j], 2026.5, false, false, &expected);
+            assert_near("Prepared Batch Inclination", expected.i, i[j], 1e-12);
+        }
+    }
+
+    geomag_free_time(&prepared);
+
+    /* The date range is checked once, when preparing */
+    if (geomag_prepare_time(&geo_mag, 2031.0, false, &prepared) != 0) {
+        printf("  ✓ Correctly rejected preparing a date outside lifespan\n");
+        test_passed++;
+    } else {
+        printf("  ✗ Should have rejected preparing a date outside lifespan\n");
+        test_failed++;
+        geomag_free_time(&prepared);
+    }
+    test_count++;
+
+    geomag_free(&geo_mag);
+}
+
 int main() {
     printf("==========================================\n");
     printf("   GeoMag C Library Test Suite\n");
@@ -314,6 +518,10 @@ int main() {
     test_high_resolution();
     test_boundary_conditions();
     test_performance();
+    test_batch();
+    test_many();
+    test_copy();
+    test_prepared_time();
 
     printf("\n==========================================\n");
     printf("Test Results: %d/%d passed, %d failed\n",
@@ -0,0 +1,292 @@
+"""Tests for the Python wrapper (run with ``make pytest`` from the repository root)."""
+
+import ctypes.util
+import gc
+import os
+import shutil
+import threading
+
+import numpy as np
+import pytest
+
+from geomag_c import RESULT_DTYPE, GeoMag, GeoMagColumns, GeoMagResult, GeoMagResultPy
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+LATS = np.arange(-85.0, 86.0, 5.0)
+LONS = np.arange(-180.0, 180.0, 7.5)
+
+# (80, -180) is in the caution zone, (89.9, 0) in the blackout zone
+CAUTION = (80.0, -180.0)
+BLACKOUT = (89.9, 0.0)
+
+# (lat, lon, alt, time) rows covering grid variation (|lat| > 55), both
+# warning zones and the edges of the altitude and time ranges
+POINTS = np.array(
+    [
+        (47.6205, -122.3493, 0.0, 2025.5),
+        (-33.9249, 18.4241, 10.0, 2026.2),
+        (75.0, -40.0, 5.0, 2027.0),
+        (-80.0, 120.0, 300.0, 2028.9),
+        (*CAUTION, 0.0, 2025.5),
+        (*BLACKOUT, 0.0, 2025.5),
+        (0.0, 0.0, 850.0, 2029.9),
+        (0.0, 179.5, -1.0, 2025.0),
+    ]
+)
+
+
+@pytest.fixture
+def gm():
+    with GeoMag() as model:
+        yield model
+
+
+def assert_same(a, b):
+    for name, x, y in zip(a._fields, a, b):
+        assert np.array_equal(x, y), name
+
+
+def reference(gm, lat, lon, alt, time):
+    """Every GeoMagResult field of a single gm.calculate call, by name."""
+    result = gm.calculate(lat, lon, alt, time)
+    return {name: getattr(result, name) for name, _ in GeoMagResult._fields_}
+
+
+def test_points_cover_every_field(gm):
+    rows = [reference(gm, *point) for point in POINTS]
+    assert any(row["gv"] != -999.0 for row in rows)
+    assert any(row["in_caution_zone"] and not row["in_blackout_zone"] for row in rows)
+    assert any(row["in_blackout_zone"] for row in rows)
+
+
+def test_calculate_many_matches_calculate(gm):
+    full = gm.calculate_many(*POINTS.T)
+    assert full.shape == (len(POINTS),)
+    for row, point in zip(full, POINTS):
+        assert {name: row[name].item() for name in full.dtype.names} == reference(gm, *point)
+
+
+def test_result_dtype_matches_result_layout(gm):
+    assert gm.calculate_many(*POINTS.T).dtype == RESULT_DTYPE
+    assert RESULT_DTYPE.names == tuple(name for name, _ in GeoMagResult._fields_)
+    for point in POINTS:
+        (row,) = np.frombuffer(gm.calculate(*point), dtype=RESULT_DTYPE)
+        assert {name: row[name].item() for name in RESULT_DTYPE.names} == reference(gm, *point)
+
+
+def test_calculate_columns_matches_calculate(gm):
+    # Catches a _GeoMagResultColumns field order that differs from the C struct
+    assert GeoMagColumns._fields == tuple(name for name, _ in GeoMagResult._fields_)
+    cols = gm.calculate_columns(*POINTS.T)
+    for column in cols:
+        assert column.shape == (len(POINTS),) and column.flags.c_contiguous
+    for j, point in enumerate(POINTS):
+        row = {name: column[j].item() for name, column in cols._asdict().items()}
+        assert row == reference(gm, *point)
+
+
+def test_to_namedtuple_matches_fields(gm):
+    assert GeoMagResultPy._fields == tuple(name for name, _ in GeoMagResult._fields_)
+    for point in POINTS:
+        as_tuple = gm.calculate(*point).to_namedtuple()
+        assert isinstance(as_tuple, GeoMagResultPy)
+        assert as_tuple._asdict() == reference(gm, *point)
+
+
+def test_copy_false_reuses_scratch_result(gm):
+    first, second = POINTS[0], POINTS[1]
+    kept = gm.calculate(*first)
+    scratch = gm.calculate(*first, copy=False)
+    assert gm.calculate(*second, copy=False) is scratch
+    # The scratch result now holds the second point; copies are untouched
+    fields = [name for name, _ in GeoMagResult._fields_]
+    assert {name: getattr(scratch, name) for name in fields} == reference(gm, *second)
+    assert {name: getattr(kept, name) for name in fields} == reference(gm, *first)
+    assert gm.calculate(*first) is not gm.calculate(*first)
+
+
+@pytest.mark.parametrize("time", [2025.0, 2027.3, 2029.9])
+def test_prepared_calculate_matches_calculate(gm, time):
+    fields = [name for name, _ in GeoMagResult._fields_]
+    with gm.prepare(time) as prepared:
+        for lat, lon, alt, _ in POINTS:
+            result = prepared.calculate(lat, lon, alt)
+            row = {name: getattr(result, name) for name in fields}
+            assert row == reference(gm, lat, lon, alt, time)
+        batch = prepared.calculate_batch(POINTS[:, 0], POINTS[:, 1], POINTS[:, 2])
+    assert_same(batch, gm.calculate_batch(POINTS[:, 0], POINTS[:, 1], POINTS[:, 2], time))
+
+
+def test_grid_workers_match_single_call(gm):
+    expected = gm.grid(LATS, LONS, 0.0, 2025.5)
+    for workers in (2, 3, 8):
+        assert_same(gm.grid(LATS, LONS, 0.0, 2025.5, workers=workers), expected)
+
+
+def test_batch_workers_match_single_call(gm):
+    times = np.linspace(2025.0, 2029.9, LATS.size)
+    expected = gm.calculate_batch(LATS, LONS[: LATS.size], 100.0, times)
+    assert_same(gm.calculate_batch(LATS, LONS[: LATS.size], 100.0, times, workers=4), expected)
+
+    with gm.prepare(2026.0) as prepared:
+        expected = prepared.calculate_batch(LATS, 0.0, 0.0)
+        assert_same(prepared.calculate_batch(LATS, 0.0, 0.0, workers=4), expected)
+
+
+def test_more_workers_than_points(gm):
+    expected = gm.calculate_batch([10.0, 20.0], [0.0, 0.0], 0.0, 2025.5)
+    assert_same(gm.calculate_batch([10.0, 20.0], [0.0, 0.0], 0.0, 2025.5, workers=8), expected)
+    assert gm.calculate_batch([], [], 0.0, 2025.5, workers=4).declination.shape == (0,)
+
+
+@pytest.mark.parametrize(
+    "first, message",
+    [(CAUTION, "caution zone"), (BLACKOUT, "blackout zone")],
+)
+@pytest.mark.parametrize("workers", [1, 2, 4])
+def test_workers_report_lowest_index_error(gm, first, message, workers):
+    # The two failing points land in different slices; the error reported is
+    # always that of the earlier point, as for a single call
+    second = BLACKOUT if first == CAUTION else CAUTION
+    points = [(0.0, 0.0), first, (10.0, 0.0), (20.0, 0.0), second, (30.0, 0.0)]
+    lats, lons = zip(*points)
+    with pytest.raises(RuntimeError, match=message):
+        gm.calculate_batch(lats, lons, 0.0, 2025.5, raise_in_warning_zone=True, workers=workers)
+
+
+def test_closed_model_rejects_calls():
+    model = GeoMag()
+    model.close()
+    model.close()
+    with pytest.raises(RuntimeError):
+        model.calculate(0.0, 0.0, 0.0, 2025.5)
+    with pytest.raises(RuntimeError):
+        model.calculate_batch([0.0], [0.0], 0.0, 2025.5)
+
+
+def test_closed_prepared_rejects_calls(gm):
+    with gm.prepare(2025.5) as prepared:
+        expected = prepared.calculate(0.0, 0.0, 0.0)
+    assert expected.f == gm.calculate(0.0, 0.0, 0.0, 2025.5).f
+    with pytest.raises(RuntimeError):
+        prepared.calculate(0.0, 0.0, 0.0)
+
+
+@pytest.mark.filterwarnings("error::ResourceWarning")
+def test_unclosed_objects_are_freed_when_warnings_are_errors():
+    model = GeoMag()
+    prepared = model.prepare(2025.5)
+    internal = model._geo_mag
+    prepared_internal = prepared._prepared
+    del prepared
+    gc.collect()
+    assert not prepared_internal.block
+    del model
+    gc.collect()
+    assert not internal.block
+
+
+def test_new_model_after_close_matches():
+    with GeoMag(high_resolution=True) as model:
+        expected = model.calculate(47.6, -122.3, 0.0, 2025.5).to_namedtuple()
+    with GeoMag(high_resolution=True) as model:
+        assert model.calculate(47.6, -122.3, 0.0, 2025.5).to_namedtuple() == expected
+
+
+def test_concurrent_construction():
+    with GeoMag(high_resolution=True) as model:
+        expected = model.calculate(47.6, -122.3, 0.0, 2025.5).f
+    errors = []
+
+    def construct():
+        for _ in range(20):
+            try:
+                with GeoMag(high_resolution=True) as model:
+                    assert model.calculate(47.6, -122.3, 0.0, 2025.5).f == expected
+            except Exception as exc:
+                errors.append(exc)
+
+    threads = [threading.Thread(target=construct) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_relative_path_cache_follows_cwd(tmp_path, monkeypatch):
+    # Same relative name, size and mtime, different coefficients
+    first = tmp_path / "a"
+    second = tmp_path / "b"
+    first.mkdir()
+    second.mkdir()
+    original = os.path.join(DATA_DIR, "WMM.COF")
+    shutil.copy(original, first / "WMM.COF")
+    with open(original, encoding="utf-8") as src:
+        (second / "WMM.COF").write_text(src.read().replace("-29351.8", "-28351.8"), encoding="utf-8")
+    stat = os.stat(first / "WMM.COF")
+    os.utime(second / "WMM.COF", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    monkeypatch.chdir(first)
+    with GeoMag("WMM.COF") as model:
+        f_first = model.calculate(0.0, 0.0, 0.0, 2025.5).f
+    monkeypatch.chdir(second)
+    with GeoMag("WMM.COF") as model:
+        f_second = model.calculate(0.0, 0.0, 0.0, 2025.5).f
+    assert f_first != f_second
+
+
+def test_model_cache_is_bounded(tmp_path):
+    original = os.path.join(DATA_DIR, "WMM.COF")
+    for i in range(GeoMag._models_max + 3):
+        path = tmp_path / f"WMM{i}.COF"
+        shutil.copy(original, path)
+        GeoMag(str(path)).close()
+        path.unlink()
+    assert len(GeoMag._models) == GeoMag._models_max
+
+
+def test_clear_cache_frees_parsed_models():
+    with GeoMag() as model:
+        expected = model.calculate(0.0, 0.0, 0.0, 2025.5).f
+        cached = list(GeoMag._models.values())
+        GeoMag.clear_cache()
+        assert len(GeoMag._models) == 0
+        assert all(not entry.block for entry in cached)
+        # Open instances keep their own coefficients
+        assert model.calculate(0.0, 0.0, 0.0, 2025.5).f == expected
+    with GeoMag() as model:
+        assert model.calculate(0.0, 0.0, 0.0, 2025.5).f == expected
+    assert len(GeoMag._models) == 1
+
+
+@pytest.fixture
+def unloaded_library(monkeypatch):
+    """Make the next GeoMag load the library again; the original is restored after."""
+    for name in ("_lib", "_lib_path", "_c_calculate_raw"):
+        monkeypatch.setattr(GeoMag, name, None)
+
+
+@pytest.mark.usefixtures("unloaded_library")
+def test_missing_library_path_warns_and_falls_back(monkeypatch, tmp_path):
+    monkeypatch.setenv("GEOMAG_LIB_PATH", str(tmp_path / "missing.so"))
+    with pytest.warns(RuntimeWarning, match="missing.so"):
+        model = GeoMag()
+    with model:
+        assert model.calculate(0.0, 0.0, 0.0, 2025.5).f > 0
+    assert GeoMag._lib_path != tmp_path / "missing.so"
+
+
+@pytest.mark.usefixtures("unloaded_library")
+def test_incompatible_library_warns_and_falls_back(monkeypatch):
+    # A library that loads but lacks the geomag entry points, like an old build
+    libm = ctypes.util.find_library("m")
+    if libm is None:
+        pytest.skip("no libm to stand in for an incompatible library")
+    monkeypatch.setenv("GEOMAG_LIB_PATH", libm)
+    with pytest.warns(RuntimeWarning, match="GEOMAG_LIB_PATH"):
+        model = GeoMag()
+    with model:
+        assert model.calculate(0.0, 0.0, 0.0, 2025.5).f > 0
+    assert GeoMag._lib_path.name != libm